@@ -9,20 +9,26 @@ Provides endpoints for:
 - Log capture for debugging
 """
 
+import asyncio
+import functools
+import inspect
 import io
-import json
 import logging
-import uuid
+import re
+from collections import deque
 from contextlib import contextmanager
-from datetime import datetime
+from secrets import token_hex
+from time import gmtime, strftime
 from typing import Any, Dict, List, Optional
 
+import orjson
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from sse_starlette.sse import EventSourceResponse
 
-from src.agents.registry import list_agents, get_agent_instance, get_agent_class
+from debug_ui.store import create_debug_store
+from src.agents.registry import list_agents, get_agent_instance, get_agent_class, clear_cache
 from src.models.base_models import AgentChatRequest, FeatureMap
 
 logger = logging.getLogger(__name__)
@@ -31,75 +37,106 @@ router = APIRouter()
 
 # ============== Log Capture ==============
 
+# Keyword patterns used to categorize captured log messages
+_TOOL_KEYWORDS_RE = re.compile(r"tool|function|calling|executing", re.IGNORECASE)
+_LLM_KEYWORDS_RE = re.compile(r"llm|model|gemini|gpt|claude|response", re.IGNORECASE)
+
+
+# Loggers the debug UI captures from (agent code and Google ADK tool calls)
+_CAPTURED_LOGGERS = ('src.agents', 'google.adk')
+_MAX_CAPTURED_LOGS = 50
+
+
+class CapturedLoggerFilter(logging.Filter):
+    """Drops records from loggers the debug UI does not display."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.name.startswith(_CAPTURED_LOGGERS)
+
+
 class LogCaptureHandler(logging.Handler):
     """Captures logs during agent execution for debug display."""
     
-    def __init__(self):
+    def __init__(self, max_logs: int = _MAX_CAPTURED_LOGS):
         super().__init__()
-        self.logs: List[Dict[str, Any]] = []
+        # Ring buffer keeps memory bounded even when an agent floods DEBUG logs
+        self.logs: deque = deque(maxlen=max_logs)
         self.setFormatter(logging.Formatter('%(asctime)s | %(name)s | %(message)s', datefmt='%H:%M:%S'))
+        self.addFilter(CapturedLoggerFilter())
     
     def emit(self, record: logging.LogRecord):
+        # getMessage() is the only step that can raise (bad format args)
         try:
-            # Categorize logs
-            category = "info"
             msg = record.getMessage()
-            
-            # Detect tool calls
-            if any(kw in msg.lower() for kw in ['tool', 'function', 'calling', 'executing']):
-                category = "tool"
-            elif any(kw in msg.lower() for kw in ['llm', 'model', 'gemini', 'gpt', 'claude', 'response']):
-                category = "llm"
-            elif record.levelno >= logging.WARNING:
-                category = "warning"
-            elif record.levelno >= logging.ERROR:
-                category = "error"
-            
-            self.logs.append({
-                "timestamp": self.format(record).split(' | ')[0],
-                "logger": record.name,
-                "level": record.levelname,
-                "message": msg,
-                "category": category
-            })
         except Exception:
-            pass
+            self.handleError(record)
+            return
+        
+        # Categorize logs
+        category = "info"
+        
+        # Detect tool calls
+        if _TOOL_KEYWORDS_RE.search(msg):
+            category = "tool"
+        elif _LLM_KEYWORDS_RE.search(msg):
+            category = "llm"
+        elif record.levelno >= logging.ERROR:
+            category = "error"
+        elif record.levelno >= logging.WARNING:
+            category = "warning"
+        
+        entry = {
+            # Only the time is needed, so skip formatting the full record
+            "timestamp": self.formatter.formatTime(record, self.formatter.datefmt),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": msg,
+            "category": category
+        }
+        self.logs.append(entry)
     
     def get_logs(self) -> List[Dict[str, Any]]:
-        return self.logs
+        """Return the most recent captured logs (only agent and ADK loggers reach this handler)."""
+        return list(self.logs)
     
     def clear(self):
-        self.logs = []
+        self.logs.clear()
 
 
 @contextmanager
-def capture_logs():
-    """Context manager to capture logs during agent execution."""
+def capture_logs(debug: bool = False):
+    """Context manager to capture logs during agent execution.
+    
+    The handler is attached only to the agent and Google ADK loggers at INFO
+    level; the root logger is left untouched. Pass ``debug=True`` to also
+    capture DEBUG records from those loggers.
+    """
+    level = logging.DEBUG if debug else logging.INFO
     handler = LogCaptureHandler()
-    handler.setLevel(logging.DEBUG)
+    handler.setLevel(level)
     
-    # Add handler to root logger and relevant agent loggers
-    root_logger = logging.getLogger()
-    original_level = root_logger.level
-    root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(handler)
+    captured_loggers = [logging.getLogger(name) for name in _CAPTURED_LOGGERS]
+    original_levels = [captured.level for captured in captured_loggers]
     
-    # Also capture google.adk logs for tool calls
-    adk_logger = logging.getLogger('google.adk')
-    adk_logger.addHandler(handler)
+    for captured in captured_loggers:
+        captured.addHandler(handler)
+        if debug:
+            captured.setLevel(logging.DEBUG)
     
     try:
         yield handler
     finally:
-        root_logger.removeHandler(handler)
-        root_logger.setLevel(original_level)
-        adk_logger.removeHandler(handler)
+        for captured, original_level in zip(captured_loggers, original_levels):
+            captured.removeHandler(handler)
+            captured.setLevel(original_level)
 
 
 # ============== Models ==============
 
 class AgentInfo(BaseModel):
     """Basic agent information."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: Optional[str] = None
     input_schema: Optional[Dict[str, Any]] = None
@@ -108,6 +145,8 @@ class AgentInfo(BaseModel):
 
 class ChatMessage(BaseModel):
     """A chat message."""
+    model_config = ConfigDict(frozen=True)
+
     role: str  # "user" or "assistant"
     content: str
     timestamp: str
@@ -116,15 +155,20 @@ class ChatMessage(BaseModel):
 
 class DebugChatRequest(BaseModel):
     """Request for debug chat."""
+    model_config = ConfigDict(frozen=True)
+
     agent_name: str
     message: str
     session_id: Optional[str] = None
     user_id: Optional[str] = None
     features: Optional[Dict[str, Any]] = None
+    debug: bool = False  # Capture DEBUG-level agent logs
 
 
 class FeedbackRequest(BaseModel):
     """Request to save feedback."""
+    model_config = ConfigDict(frozen=True)
+
     session_id: str
     message_index: int
     feedback: str  # "up" or "down"
@@ -135,32 +179,59 @@ class FeedbackRequest(BaseModel):
 
 class SessionInfo(BaseModel):
     """Session information."""
+    model_config = ConfigDict(frozen=True)
+
     session_id: str
     agent_name: str
     created_at: str
     message_count: int
 
 
-# ============== In-Memory Storage ==============
-# For tracking feedback and sessions in debug mode
+# ============== Storage ==============
+# For tracking feedback and sessions in debug mode (bounded in-memory by
+# default, shared via Redis when DEBUG_UI_REDIS_URL is set)
 
-_feedback_store: List[Dict[str, Any]] = []
-_sessions: Dict[str, SessionInfo] = {}
+_store = create_debug_store()
 
 
 # ============== Helper Functions ==============
+# Agent classes and their Pydantic schemas are static at runtime, so schema
+# lookups are cached per agent instead of re-introspecting on every request.
+
+_agents_cache: Optional[tuple] = None  # (agent names, AgentInfo list as JSON bytes)
+
+# Shared defaults for debug chat requests; per-request fields are applied with
+# model_copy(update=...) so nothing is revalidated
+_CHAT_REQUEST_TEMPLATE = AgentChatRequest.model_construct(
+    agent_name="", user_id=None, session_id=None, sender="USER", query=None,
+)
+
+# Validates and serializes the whole /agents payload in one pydantic-core call
+_AGENT_INFO_LIST = TypeAdapter(List[AgentInfo])
+
+# Fields checked, in order, for the text to show from an agent response
+_RESPONSE_TEXT_KEYS = (
+    'response', 'text', 'answer', 'translated_text',
+    'summary', 'message', 'flight_plan', 'hotel_plan',
+)
+
+
+def _now_iso() -> str:
+    """Current UTC time as a second-resolution ISO-8601 string (C-level strftime)."""
+    return strftime('%Y-%m-%dT%H:%M:%SZ', gmtime())
+
 
+@functools.lru_cache(maxsize=None)
 def _find_schema_classes_from_module(agent_class) -> tuple:
     """Find Input/Output schema classes from the agent's module."""
-    import inspect
-    
     module = inspect.getmodule(agent_class)
     input_schema = None
     output_schema = None
     
     if module:
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if hasattr(obj, 'model_json_schema'):
+        # Plain namespace scan; getmembers sorts and getattr()s every attribute
+        for name, obj in vars(module).items():
+            if isinstance(obj, type) and hasattr(obj, 'model_json_schema'):
                 if name.endswith("Input"):
                     input_schema = obj
                 elif name.endswith("Output"):
@@ -169,69 +240,122 @@ def _find_schema_classes_from_module(agent_class) -> tuple:
     return input_schema, output_schema
 
 
+@functools.lru_cache(maxsize=None)
+def _build_agent_schema(agent_name: str) -> Dict[str, Any]:
+    """Build input/output schema for an agent (cached; failures are not cached)."""
+    agent_class = get_agent_class(agent_name)
+    input_schema_class, output_schema_class = _find_schema_classes_from_module(agent_class)
+    
+    result = {"input": {}, "output": {}}
+    
+    if input_schema_class:
+        schema = input_schema_class.model_json_schema()
+        result["input"] = {
+            "title": schema.get("title", "Input"),
+            "properties": schema.get("properties", {}),
+            "required": schema.get("required", [])
+        }
+    
+    if output_schema_class:
+        schema = output_schema_class.model_json_schema()
+        result["output"] = {
+            "title": schema.get("title", "Output"),
+            "properties": schema.get("properties", {}),
+            "required": schema.get("required", [])
+        }
+    
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _chat_is_async(agent_class) -> bool:
+    """Whether the agent class implements ``chat`` as a coroutine (checked once per class)."""
+    return inspect.iscoroutinefunction(agent_class.chat)
+
+
+async def _run_chat(agent, chat_request: AgentChatRequest):
+    """Call ``agent.chat``, moving synchronous implementations off the event loop."""
+    if _chat_is_async(type(agent)):
+        return await agent.chat(chat_request)
+    return await asyncio.to_thread(agent.chat, chat_request)
+
+
+@functools.lru_cache(maxsize=None)
+def _agent_schema_json(agent_name: str) -> bytes:
+    """Schema response for an agent, serialized once (failures are not cached)."""
+    return orjson.dumps(_build_agent_schema(agent_name))
+
+
 def _get_agent_schema(agent_name: str) -> Dict[str, Any]:
     """Get input/output schema for an agent without instantiating it."""
     try:
-        agent_class = get_agent_class(agent_name)
-        input_schema_class, output_schema_class = _find_schema_classes_from_module(agent_class)
-        
-        result = {"input": {}, "output": {}}
-        
-        if input_schema_class:
-            schema = input_schema_class.model_json_schema()
-            result["input"] = {
-                "title": schema.get("title", "Input"),
-                "properties": schema.get("properties", {}),
-                "required": schema.get("required", [])
-            }
-        
-        if output_schema_class:
-            schema = output_schema_class.model_json_schema()
-            result["output"] = {
-                "title": schema.get("title", "Output"),
-                "properties": schema.get("properties", {}),
-                "required": schema.get("required", [])
-            }
-        
-        return result
+        return _build_agent_schema(agent_name)
     except Exception as e:
-        logger.warning(f"Could not get schema for {agent_name}: {e}")
+        logger.warning("Could not get schema for %s: %s", agent_name, e)
         return {"input": {}, "output": {}}
 
 
 # ============== Endpoints ==============
 
-@router.get("/agents", response_model=List[AgentInfo])
+# The AgentInfo list is built from validated models already, so FastAPI's
+# response-model validation is skipped; `responses` keeps it in the OpenAPI docs.
+@router.get("/agents", response_model=None, responses={200: {"model": List[AgentInfo]}})
 async def get_agents():
     """Get list of all available agents with their schemas."""
+    global _agents_cache
     try:
-        agent_names = list_agents()
+        agent_names = tuple(list_agents())
+        
+        # Rebuild only when the set of registered agents changes
+        if _agents_cache is not None and _agents_cache[0] == agent_names:
+            return Response(content=_agents_cache[1], media_type="application/json")
+        
         agents = []
+        all_schemas_built = True
         
         for name in agent_names:
-            schema = _get_agent_schema(name)
-            agents.append(AgentInfo(
-                name=name,
-                description=f"Agent: {name}",
-                input_schema=schema.get("input"),
-                output_schema=schema.get("output")
-            ))
+            try:
+                schema = _build_agent_schema(name)
+            except Exception as e:
+                logger.warning("Could not get schema for %s: %s", name, e)
+                schema = {"input": {}, "output": {}}
+                all_schemas_built = False
+            agents.append({
+                "name": name,
+                "description": f"Agent: {name}",
+                "input_schema": schema.get("input"),
+                "output_schema": schema.get("output"),
+            })
         
-        return agents
+        content = _AGENT_INFO_LIST.dump_json(_AGENT_INFO_LIST.validate_python(agents))
+        # Don't freeze empty fallback schemas; retry the failed agents next request
+        if all_schemas_built:
+            _agents_cache = (agent_names, content)
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         logger.exception("Failed to list agents")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/agents/_reload")
+async def reload_agents():
+    """Drop cached agent instances so the next request builds fresh ones.
+
+    Picks up agent config (YAML) changes without a restart. Agent modules are
+    not re-imported, so Python code changes still need a restart.
+    """
+    clear_cache()
+    return {"success": True}
+
+
 @router.get("/agents/{agent_name}/schema")
 async def get_agent_schema(agent_name: str):
     """Get detailed schema for a specific agent."""
     try:
-        schema = _get_agent_schema(agent_name)
-        return schema
-    except Exception as e:
-        logger.exception(f"Failed to get schema for {agent_name}")
-        raise HTTPException(status_code=500, detail=str(e))
+        return Response(content=_agent_schema_json(agent_name), media_type="application/json")
+    except Exception:
+        # Unknown agent or broken schema - empty schemas (not cached), warning logged
+        return _get_agent_schema(agent_name)
 
 
 @router.post("/chat")
@@ -244,8 +368,8 @@ async def debug_chat(request: DebugChatRequest):
     
     try:
         # Generate IDs if not provided
-        session_id = request.session_id or f"debug_{uuid.uuid4().hex[:12]}"
-        user_id = request.user_id or f"debug_user_{uuid.uuid4().hex[:8]}"
+        session_id = request.session_id or f"debug_{token_hex(6)}"
+        user_id = request.user_id or f"debug_user_{token_hex(4)}"
         
         # Build query from features (form data) or message
         if request.features:
@@ -255,23 +379,22 @@ async def debug_chat(request: DebugChatRequest):
         else:
             query = {"text": request.message}
         
-        # Create chat request
-        chat_request = AgentChatRequest(
-            agent_name=request.agent_name,
-            user_id=user_id,
-            session_id=session_id,
-            sender="USER",
-            query=query,
-            features=[]
-        )
+        # Create chat request - fields come from the already-validated DebugChatRequest
+        chat_request = _CHAT_REQUEST_TEMPLATE.model_copy(update={
+            "agent_name": request.agent_name,
+            "user_id": user_id,
+            "session_id": session_id,
+            "query": query,
+            "features": [],
+        })
         
-        logger.info(f"Debug chat request: agent={request.agent_name}")
+        logger.info("Debug chat request: agent=%s", request.agent_name)
         
         # Capture logs during agent execution
-        with capture_logs() as log_handler:
+        with capture_logs(debug=request.debug) as log_handler:
             # Get agent and chat
             agent = get_agent_instance(request.agent_name)
-            result = await agent.chat(chat_request)
+            result = await _run_chat(agent, chat_request)
             captured_logs = log_handler.get_logs()
         
         # Extract response text - handle various response formats
@@ -279,60 +402,48 @@ async def debug_chat(request: DebugChatRequest):
         if hasattr(result, 'agent_response'):
             resp = result.agent_response
             
-            # Handle Pydantic models
-            if hasattr(resp, 'model_dump'):
-                resp = resp.model_dump()
-            elif hasattr(resp, 'dict'):
-                resp = resp.dict()
-            
-            if isinstance(resp, dict):
-                response_text = (
-                    resp.get('response') or 
-                    resp.get('text') or 
-                    resp.get('answer') or 
-                    resp.get('translated_text') or
-                    resp.get('summary') or
-                    resp.get('message') or
-                    resp.get('flight_plan') or
-                    resp.get('hotel_plan') or
-                    json.dumps(resp, indent=2)
-                )
-            elif isinstance(resp, str):
-                response_text = resp
+            # Handle Pydantic models - read the known text fields directly and
+            # only serialize the whole model when none of them is set
+            if hasattr(resp, 'model_dump_json'):
+                response_text = next(
+                    filter(None, (getattr(resp, key, None) for key in _RESPONSE_TEXT_KEYS)),
+                    None,
+                ) or resp.model_dump_json(indent=2)
             else:
-                try:
-                    if hasattr(resp, '__dict__'):
-                        resp_dict = {k: v for k, v in resp.__dict__.items() if not k.startswith('_')}
-                        response_text = json.dumps(resp_dict, indent=2, default=str)
-                    else:
+                if hasattr(resp, 'dict'):
+                    resp = resp.dict()
+                
+                if isinstance(resp, dict):
+                    response_text = next(
+                        filter(None, (resp.get(key) for key in _RESPONSE_TEXT_KEYS)),
+                        None,
+                    ) or orjson.dumps(resp, option=orjson.OPT_INDENT_2).decode()
+                elif isinstance(resp, str):
+                    response_text = resp
+                else:
+                    try:
+                        if hasattr(resp, '__dict__'):
+                            resp_dict = {k: v for k, v in resp.__dict__.items() if not k.startswith('_')}
+                            response_text = orjson.dumps(resp_dict, default=str, option=orjson.OPT_INDENT_2).decode()
+                        else:
+                            response_text = str(resp)
+                    except:
                         response_text = str(resp)
-                except:
-                    response_text = str(resp)
         
         # Track session
-        if session_id not in _sessions:
-            _sessions[session_id] = SessionInfo(
-                session_id=session_id,
-                agent_name=request.agent_name,
-                created_at=datetime.now().isoformat(),
-                message_count=0
-            )
-        _sessions[session_id].message_count += 1
-        
-        # Filter logs to show only interesting ones
-        filtered_logs = [
-            log for log in captured_logs 
-            if log['category'] in ['tool', 'llm', 'warning', 'error'] 
-            or 'agent' in log['logger'].lower()
-            or 'adk' in log['logger'].lower()
-        ]
+        await _store.record_message(SessionInfo(
+            session_id=session_id,
+            agent_name=request.agent_name,
+            created_at=_now_iso(),
+            message_count=0
+        ).model_dump())
         
         return {
             "session_id": session_id,
             "user_id": user_id,
             "response": response_text,
             "success": True,
-            "logs": filtered_logs[-50:]  # Last 50 relevant logs
+            "logs": captured_logs  # Last 50 captured logs
         }
         
     except Exception as e:
@@ -354,27 +465,27 @@ async def debug_chat_stream(request: DebugChatRequest):
     - done: Stream complete
     - error: An error occurred
     """
-    logger.info(f"🚀 Stream request received for agent: {request.agent_name}")
+    logger.info("🚀 Stream request received for agent: %s", request.agent_name)
     
     async def event_generator():
         stream_completed = False  # Initialize before try block
         try:
-            session_id = request.session_id or f"debug_{uuid.uuid4().hex[:12]}"
-            user_id = request.user_id or f"debug_user_{uuid.uuid4().hex[:8]}"
+            session_id = request.session_id or f"debug_{token_hex(6)}"
+            user_id = request.user_id or f"debug_user_{token_hex(4)}"
             
-            logger.info(f"📡 Starting stream for session: {session_id}")
+            logger.info("📡 Starting stream for session: %s", session_id)
             
             # Send session info first
             yield {
                 "event": "session",
-                "data": json.dumps({"session_id": session_id, "user_id": user_id})
+                "data": orjson.dumps({"session_id": session_id, "user_id": user_id}).decode()
             }
             
-            # Build features
-            features = []
-            if request.features:
-                for key, value in request.features.items():
-                    features.append(FeatureMap(feature_name=key, feature_value=value))
+            # Build features - values were validated on ingress, so skip revalidation
+            features = [
+                FeatureMap.model_construct(feature_name=key, feature_value=value)
+                for key, value in (request.features or {}).items()
+            ]
             
             # Parse the query - prefer features (form data) over message (JSON string)
             # The debug UI sends form data as features, and message as JSON.stringify(formData)
@@ -384,30 +495,32 @@ async def debug_chat_stream(request: DebugChatRequest):
             if request.features:
                 query = dict(request.features)
             
-            # If no features but message is provided, try to parse it as JSON
+            # If no features but message is provided, try to parse it as JSON.
+            # Only JSON objects become the query, so plain chat text skips the
+            # decode (and its exception) entirely
             if not query and request.message:
-                try:
-                    parsed_message = json.loads(request.message)
-                    if isinstance(parsed_message, dict):
-                        query = parsed_message
+                query = {"text": request.message}
+                if request.message.lstrip().startswith("{"):
+                    try:
+                        parsed_message = orjson.loads(request.message)
+                    except orjson.JSONDecodeError:
+                        pass
                     else:
-                        query = {"text": request.message}
-                except (json.JSONDecodeError, TypeError):
-                    query = {"text": request.message}
+                        if isinstance(parsed_message, dict):
+                            query = parsed_message
             
             # Create request
-            chat_request = AgentChatRequest(
-                agent_name=request.agent_name,
-                user_id=user_id,
-                session_id=session_id,
-                sender="USER",
-                query=query,
-                features=features
-            )
+            chat_request = _CHAT_REQUEST_TEMPLATE.model_copy(update={
+                "agent_name": request.agent_name,
+                "user_id": user_id,
+                "session_id": session_id,
+                "query": query,
+                "features": features,
+            })
             
             # Get agent and use streaming chat
             agent = get_agent_instance(request.agent_name)
-            logger.info(f"🤖 Got agent instance, starting chat_stream...")
+            logger.info("🤖 Got agent instance, starting chat_stream...")
             
             # Stream real events from the agent
             try:
@@ -416,55 +529,58 @@ async def debug_chat_stream(request: DebugChatRequest):
                     
                     # Log content events with their actual content
                     if event_type == "content":
-                        content_text = event.get("text", "") or event.get("content", "")
-                        logger.info(f"📨 Yielding content event: type={event_type}, text_length={len(str(content_text))}, preview={str(content_text)[:100] if content_text else 'EMPTY'}")
+                        content_text = str(event.get("text") or event.get("content") or "")
+                        logger.info(
+                            "📨 Yielding content event: type=%s, text_length=%d, preview=%s",
+                            event_type, len(content_text), content_text[:100] or 'EMPTY',
+                        )
                     else:
-                        logger.info(f"📨 Yielding event: {event_type}")
+                        logger.info("📨 Yielding event: %s", event_type)
                     
                     # Skip duplicate "done" events (agent already sends one)
                     if event_type == "done":
                         stream_completed = True
                     
+                    # Serialize once; reused for the log line and the SSE frame
+                    event_data_str = orjson.dumps(event).decode()
+                    
                     # Log the actual data being sent for content events
                     if event_type == "content":
-                        event_data_str = json.dumps(event)
-                        logger.info(f"📤 Sending content event via SSE: event={event_type}, data_length={len(event_data_str)}, data_preview={event_data_str[:200]}")
+                        logger.info("📤 Sending content event via SSE: event=%s, data_length=%s, data_preview=%s", event_type, len(event_data_str), event_data_str[:200])
                     
                     yield {
                         "event": event_type,
-                        "data": json.dumps(event)
+                        "data": event_data_str
                     }
                 
                 # Track session after streaming completes successfully
-                if session_id not in _sessions:
-                    _sessions[session_id] = SessionInfo(
-                        session_id=session_id,
-                        agent_name=request.agent_name,
-                        created_at=datetime.now().isoformat(),
-                        message_count=0
-                    )
-                _sessions[session_id].message_count += 1
+                await _store.record_message(SessionInfo(
+                    session_id=session_id,
+                    agent_name=request.agent_name,
+                    created_at=_now_iso(),
+                    message_count=0
+                ).model_dump())
                 stream_completed = True
                 
             except Exception as stream_error:
                 logger.exception("Error during agent chat_stream")
                 yield {
                     "event": "error",
-                    "data": json.dumps({"type": "error", "message": str(stream_error)})
+                    "data": orjson.dumps({"type": "error", "message": str(stream_error)}).decode()
                 }
             
         except Exception as e:
             logger.exception("Streaming chat failed")
             yield {
                 "event": "error",
-                "data": json.dumps({"type": "error", "message": str(e)})
+                "data": orjson.dumps({"type": "error", "message": str(e)}).decode()
             }
         finally:
             # Always yield a done event to properly close the stream (if agent didn't already)
             if not stream_completed:
                 yield {
                     "event": "done",
-                    "data": json.dumps({"type": "done"})
+                    "data": orjson.dumps({"type": "done"}).decode()
                 }
     
     return EventSourceResponse(event_generator())
@@ -475,8 +591,8 @@ async def save_feedback(request: FeedbackRequest):
     """Save feedback for a message."""
     try:
         feedback_entry = {
-            "id": str(uuid.uuid4()),
-            "timestamp": datetime.now().isoformat(),
+            "id": token_hex(16),
+            "timestamp": _now_iso(),
             "session_id": request.session_id,
             "message_index": request.message_index,
             "feedback": request.feedback,
@@ -485,8 +601,8 @@ async def save_feedback(request: FeedbackRequest):
             "assistant_message": request.assistant_message
         }
         
-        _feedback_store.append(feedback_entry)
-        logger.info(f"Feedback saved: {request.feedback} for {request.agent_name}")
+        await _store.add_feedback(feedback_entry)
+        logger.info("Feedback saved: %s for %s", request.feedback, request.agent_name)
         
         return {"success": True, "id": feedback_entry["id"]}
         
@@ -498,20 +614,20 @@ async def save_feedback(request: FeedbackRequest):
 @router.get("/feedback")
 async def get_feedback():
     """Get all feedback (for debugging/export)."""
-    return _feedback_store
+    # Entries are plain JSON-ready dicts; skip FastAPI's jsonable_encoder pass
+    return JSONResponse(content=await _store.list_feedback())
 
 
 @router.get("/sessions")
 async def get_sessions():
     """Get all debug sessions."""
-    return list(_sessions.values())
+    return JSONResponse(content=await _store.list_sessions())
 
 
 @router.delete("/sessions/{session_id}")
 async def delete_session(session_id: str):
     """Delete a debug session."""
-    if session_id in _sessions:
-        del _sessions[session_id]
+    if await _store.delete_session(session_id):
         return {"success": True}
     raise HTTPException(status_code=404, detail="Session not found")
 
@@ -519,12 +635,13 @@ async def delete_session(session_id: str):
 @router.post("/sessions")
 async def create_session(agent_name: str):
     """Create a new debug session."""
-    session_id = f"debug_{uuid.uuid4().hex[:12]}"
-    _sessions[session_id] = SessionInfo(
+    session_id = f"debug_{token_hex(6)}"
+    session = SessionInfo(
         session_id=session_id,
         agent_name=agent_name,
-        created_at=datetime.now().isoformat(),
+        created_at=_now_iso(),
         message_count=0
     )
-    return _sessions[session_id]
+    await _store.create_session(session.model_dump())
+    return session
 
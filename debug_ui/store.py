@@ -0,0 +1,140 @@
+"""
+Session and feedback storage for the Debug UI.
+
+By default sessions and feedback are kept in bounded in-process structures.
+Set ``DEBUG_UI_REDIS_URL`` (e.g. ``redis://localhost:6379/0`` or
+``unix:///var/run/redis/redis.sock``) to share them across workers via Redis,
+with TTL-based session expiry and a capped feedback stream.
+"""
+
+import logging
+import os
+from collections import OrderedDict, deque
+from typing import Any, Dict, List
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+MAX_SESSIONS = 1000
+MAX_FEEDBACK = 10000
+SESSION_TTL_SECONDS = 86400
+
+_SESSION_KEY_PREFIX = "debug_ui:session:"
+_FEEDBACK_STREAM_KEY = "debug_ui:feedback"
+
+
+class InMemoryDebugStore:
+    """Bounded per-process store (oldest sessions/feedback are evicted first)."""
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, max_feedback: int = MAX_FEEDBACK):
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._feedback: deque = deque(maxlen=max_feedback)
+        self._max_sessions = max_sessions
+
+    async def create_session(self, session: Dict[str, Any]) -> None:
+        self._sessions[session["session_id"]] = dict(session)
+        while len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
+
+    async def record_message(self, session: Dict[str, Any]) -> None:
+        """Create the session if needed and increment its message count."""
+        if session["session_id"] not in self._sessions:
+            await self.create_session(session)
+        self._sessions[session["session_id"]]["message_count"] += 1
+
+    async def list_sessions(self) -> List[Dict[str, Any]]:
+        return list(self._sessions.values())
+
+    async def delete_session(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+    async def add_feedback(self, entry: Dict[str, Any]) -> None:
+        self._feedback.append(entry)
+
+    async def list_feedback(self) -> List[Dict[str, Any]]:
+        return list(self._feedback)
+
+
+class RedisDebugStore:
+    """Redis-backed store shared by all workers.
+
+    Sessions are hashes under ``debug_ui:session:<id>`` that expire after
+    ``SESSION_TTL_SECONDS``; feedback entries go to a stream capped at
+    roughly ``MAX_FEEDBACK`` entries, each JSON-encoded into a single field
+    so values keep their types (and ``None``) on the way back.
+    """
+
+    def __init__(self, client, session_ttl: int = SESSION_TTL_SECONDS, max_feedback: int = MAX_FEEDBACK):
+        self._redis = client
+        self._session_ttl = session_ttl
+        self._max_feedback = max_feedback
+
+    async def create_session(self, session: Dict[str, Any]) -> None:
+        key = _SESSION_KEY_PREFIX + session["session_id"]
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=session)
+            pipe.expire(key, self._session_ttl)
+            await pipe.execute()
+
+    async def record_message(self, session: Dict[str, Any]) -> None:
+        """Create the session if needed and increment its message count."""
+        key = _SESSION_KEY_PREFIX + session["session_id"]
+        fields = {k: v for k, v in session.items() if k != "message_count"}
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for field, value in fields.items():
+                pipe.hsetnx(key, field, value)
+            pipe.hincrby(key, "message_count", 1)
+            pipe.expire(key, self._session_ttl)
+            await pipe.execute()
+
+    async def list_sessions(self) -> List[Dict[str, Any]]:
+        keys = [key async for key in self._redis.scan_iter(match=_SESSION_KEY_PREFIX + "*")]
+        if not keys:
+            return []
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hgetall(key)
+            rows = await pipe.execute()
+        sessions = []
+        for row in rows:
+            if row:
+                row["message_count"] = int(row.get("message_count", 0))
+                sessions.append(row)
+        return sessions
+
+    async def delete_session(self, session_id: str) -> bool:
+        return bool(await self._redis.delete(_SESSION_KEY_PREFIX + session_id))
+
+    async def add_feedback(self, entry: Dict[str, Any]) -> None:
+        await self._redis.xadd(
+            _FEEDBACK_STREAM_KEY,
+            {"entry": orjson.dumps(entry)},
+            maxlen=self._max_feedback,
+            approximate=True,
+        )
+
+    async def list_feedback(self) -> List[Dict[str, Any]]:
+        entries = await self._redis.xrange(_FEEDBACK_STREAM_KEY)
+        return [orjson.loads(fields["entry"]) for _, fields in entries]
+
+
+def create_debug_store():
+    """Create the store for the Debug UI.
+
+    Uses Redis when ``DEBUG_UI_REDIS_URL`` is set and the ``redis`` package is
+    installed; otherwise falls back to the bounded in-memory store.
+    """
+    redis_url = os.getenv("DEBUG_UI_REDIS_URL")
+    if not redis_url:
+        return InMemoryDebugStore()
+
+    try:
+        # Lazy import - redis is only needed for multi-worker deployments
+        from redis.asyncio import Redis
+    except ImportError:
+        logger.warning("DEBUG_UI_REDIS_URL is set but redis is not installed; using in-memory debug store")
+        return InMemoryDebugStore()
+
+    logger.info("Using Redis debug store")
+    return RedisDebugStore(Redis.from_url(redis_url, decode_responses=True))
@@ -1,6 +1,15 @@
 from src.log_settings import configure_logging
-from src.agents.registry import registry
 
 __all__ = ["configure_logging", "registry"]
 
-configure_logging()
\ No newline at end of file
+configure_logging()
+
+
+def __getattr__(name):
+    # Importing the registry pulls in BaseAgent and Google ADK, so only do it
+    # when `src.registry` is actually used rather than for any `src.*` import
+    if name == "registry":
+        from src.agents.registry import registry
+
+        return registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
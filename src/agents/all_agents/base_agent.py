@@ -6,5 +6,6 @@ The actual implementation lives in `src.agents.core.base_agent`.
 
 from src.agents.core.types import AgentType
 from src.agents.core.base_agent import BaseAgent
+from src.agents.core.io import AgentResponseParseError
 
-__all__ = ["BaseAgent", "AgentType"]
+__all__ = ["BaseAgent", "AgentType", "AgentResponseParseError"]
@@ -1,13 +1,20 @@
 """Azure artifact reading agent for PDF files from Azure Blob Storage."""
 
+import functools
 from typing import List
 from pydantic import BaseModel, Field
 from src.agents.all_agents.base_agent import BaseAgent
-from src.models.base_models import AgentChatRequest, AgentChatResponse
+from src.models.base_models import AgentChatRequest
 from src.agents.tools.azure_artifact_reading_tool import AzureArtifactTool
 from google.adk.tools import FunctionTool
 
 
+@functools.lru_cache(maxsize=None)
+def _azure_function_tool() -> FunctionTool:
+    """Shared FunctionTool for AzureArtifactTool, built on first use."""
+    return AzureArtifactTool().to_function_tool()
+
+
 class FileAnalysisInput(BaseModel):
     """Input for file analysis."""
     file_path: str = Field(description="The azure blob path to the file. Format: container/blob_name.")
@@ -32,37 +39,16 @@ class FileAnalysisAgent(BaseAgent):
             output_schema=FileAnalysisOutput
         )
 
-    async def chat(self, request: AgentChatRequest) -> AgentChatResponse:
-        """Chat with the agent - custom implementation for artifact handling."""
+    def _create_input_from_request(self, request: AgentChatRequest) -> BaseModel:
+        """Analyze the first artifact; the query itself is not used."""
+        # Raised here rather than in chat() so chat_stream() rejects it too
         if not request.artifacts:
-            return AgentChatResponse(
-                agent_name=self._get_agent_name(),
-                user_id=request.user_id,
-                session_id=request.session_id,
-                success=False,
-                agent_response="No artifacts provided"
-            )
-
-        file_path = request.artifacts[0].artifact_path
-
-        # Run the agent with the input
-        result = await self.run(
-            user_id=request.user_id,
-            session_id=request.session_id,
-            input_data=FileAnalysisInput(file_path=file_path)
-        )
-        
-        return AgentChatResponse(
-            agent_name=self._get_agent_name(),
-            user_id=request.user_id,
-            session_id=request.session_id,
-            success=True,
-            agent_response=result
-        )
+            raise ValueError("No artifacts provided")
+        # file_path comes from the validated request, so skip revalidating it
+        return FileAnalysisInput.model_construct(file_path=request.artifacts[0].artifact_path)
 
     def _create_tools(self) -> List[FunctionTool]:
         """Create the tools for the agent."""
-        azure_tool = AzureArtifactTool()
-        return [FunctionTool(azure_tool.run)]
+        return [_azure_function_tool()]
     
     # No need to override _create_sub_agents() - defaults to empty list
@@ -42,15 +42,15 @@ class TripPlannerAgent(BaseAgent):
 
 if __name__ == "__main__":
     import asyncio
-    import hashlib
+    import secrets
     from src.models.base_models import AgentChatRequest
     
     async def main():
         agent = TripPlannerAgent()
         
-        # Generate a deterministic session ID
+        # Generate a fresh random session ID
         user_id = "123"
-        session_id = hashlib.md5(f"{user_id}".encode()).hexdigest()[:8]
+        session_id = secrets.token_hex(4)
         print(f"Generated session ID: {session_id}")
         
         query = {"source": "New York", "destination": "Los Angeles"}
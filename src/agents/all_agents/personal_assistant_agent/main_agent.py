@@ -35,8 +35,13 @@ class PersonalAssistantAgent(BaseAgent):
 
     def _create_input_from_request(self, request: AgentChatRequest) -> BaseModel:
         """Create input schema from request with message, session_id, and user_id."""
+        query = request.query
+        if isinstance(query, dict):
+            # Structured queries (e.g. debug UI form data) carry the text in a field;
+            # only stringify the whole payload if neither field is present
+            query = query.get("message") or query.get("text") or query
         return PersonalAssistantInput(
-            message=request.query if isinstance(request.query, str) else str(request.query),
+            message=query if isinstance(query, str) else str(query),
             session_id=request.session_id,
             user_id=request.user_id,
         )
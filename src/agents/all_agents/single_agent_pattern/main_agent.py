@@ -20,6 +20,11 @@ class TranslationOutput(BaseModel):
 class TranslationAgent(BaseAgent):
     """Agent for generating translation."""
 
+    # A translation depends only on the text and languages, so repeat requests
+    # can reuse the previous result instead of calling the LLM again. Cached
+    # turns skip the runner, so they are not recorded in the session history.
+    response_cache_ttl = 300
+
     def __init__(self):
         """Initialize the translation agent."""
         # Config auto-loads from main_agent.yaml, chat() is implemented by base class
@@ -35,15 +40,15 @@ class TranslationAgent(BaseAgent):
 
 if __name__ == "__main__":
     import asyncio
-    import hashlib
+    import secrets
     from src.models.base_models import AgentChatRequest
     
     async def main():
         agent = TranslationAgent()
         
-        # Generate a deterministic session ID
+        # Generate a fresh random session ID
         user_id = "123"
-        session_id = hashlib.md5(f"{user_id}".encode()).hexdigest()[:8]
+        session_id = secrets.token_hex(4)
         print(f"Generated session ID: {session_id}")
         
         query = {"text": "Hello, how are you?", "from_language": "en", "to_language": "es"}
@@ -1,5 +1,6 @@
 """Database information fetching agent."""
 
+import functools
 from typing import List
 from src.agents.all_agents.base_agent import BaseAgent
 from src.agents.tools.database_tool import DatabaseInfoTool
@@ -7,6 +8,12 @@ from src.models.base_models import TextInput, TextOutput
 from google.adk.tools import FunctionTool
 
 
+@functools.lru_cache(maxsize=None)
+def _database_function_tool() -> FunctionTool:
+    """Shared FunctionTool for DatabaseInfoTool, built on first use."""
+    return DatabaseInfoTool().to_function_tool()
+
+
 class DatabaseAgent(BaseAgent):
     """Agent for fetching database information and performing queries."""
 
@@ -21,8 +28,7 @@ class DatabaseAgent(BaseAgent):
 
     def _create_tools(self) -> List[FunctionTool]:
         """Create the tools for the database agent."""
-        database_tool = DatabaseInfoTool()
-        return [FunctionTool(database_tool.run)]
+        return [_database_function_tool()]
     
     # No need to override chat() - base class handles it!
     # No need to override _create_sub_agents() - defaults to empty list
@@ -4,9 +4,18 @@ from src.agents.configs.llm_provider_config import (
     LLMProviderConfig,
 )
 from typing import List, Any, Dict
+import logging
 import yaml
 import os
 
+logger = logging.getLogger(__name__)
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics, much faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None)
+if _YAML_LOADER is None:
+    logger.warning("PyYAML was built without libyaml; agent configs will use the slower pure-Python loader")
+    _YAML_LOADER = yaml.SafeLoader
+
 
 class AgentConfig:
     """
@@ -28,6 +37,7 @@ class AgentConfig:
         instruction_template: str = "",
         tags: List[str] = [],
         tools: List[Dict[str, Any]] | None = None,
+        max_concurrency: int | None = None,
     ):
         self.model_provider = LLMProviderConfig.get_llm_provider(llm_provider_name)
         self.model = llm_model
@@ -42,6 +52,10 @@ class AgentConfig:
         # The BaseAgent class is responsible for interpreting this structure.
         self.tools: List[Dict[str, Any]] = tools or []
 
+        # Optional cap on concurrent runs of this agent within a process
+        # (None means unbounded)
+        self.max_concurrency = max_concurrency
+
         # Observability is configured purely via environment per Opik guide
 
         # Validate that the model belongs to the correct provider
@@ -78,7 +92,7 @@ class AgentConfig:
             raise FileNotFoundError(f"Agent config file not found: {file_path}")
         
         with open(file_path, "r") as file:
-            config = yaml.safe_load(file)
+            config = yaml.load(file, Loader=_YAML_LOADER)
 
         return cls(
             llm_provider_name=LLMProviderName(config["llm_provider_name"]),
@@ -89,6 +103,7 @@ class AgentConfig:
             instruction_template=config["instruction_template"],
             tags=config.get("tags", []),
             tools=config.get("tools", []) or [],
+            max_concurrency=config.get("max_concurrency"),
         )
 
     def __str__(self):
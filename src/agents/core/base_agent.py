@@ -6,21 +6,20 @@ that the code is easier to read and extend.
 """
 
 import abc
+import asyncio
+import contextlib
+import functools
 import logging
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type
-
-from dotenv import load_dotenv
-from google.adk import Agent
-from google.adk.agents import LlmAgent, ParallelAgent, SequentialAgent
-from google.adk.models.lite_llm import LiteLlm
-from google.adk.runners import Runner
-from google.genai import types
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Type
+
 from pydantic import BaseModel
 
 from src.agents.configs.agent_config import AgentConfig
+from src.agents.core.cache import ResponseCache
 from src.agents.core.config import load_agent_config
-from src.agents.core.io import create_input_from_request, parse_agent_response
-from src.agents.core.observability import create_observer
+from src.agents.core.io import create_user_content, get_input_builder, parse_agent_response
+from src.agents.core.observability import create_observer, observer_callback_kwargs
 from src.agents.core.tools import build_tools_from_config
 from src.agents.core.types import AgentType
 from src.agents.modules import (
@@ -29,12 +28,43 @@ from src.agents.modules import (
     SessionManager,
     SessionServiceFactory,
 )
-from src.models.base_models import AgentChatRequest, AgentChatResponse, TextInput, TextOutput
+from src.agents.modules.session_manager import is_session_not_found_error
+from src.models.base_models import AgentChatRequest, AgentChatResponse, FeatureMap, TextInput, TextOutput
+
+if TYPE_CHECKING:
+    from google.adk import Agent
+    from google.adk.models.lite_llm import LiteLlm
+    from google.genai import types
 
 
-load_dotenv()
 logger = logging.getLogger(__name__)
 
+# dotenv and the ADK agent/runner classes are imported on first agent
+# construction rather than at module import time.
+_dotenv_loaded = False
+
+
+def _load_dotenv_once() -> None:
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+@functools.lru_cache(maxsize=None)
+def _agent_classes_by_type() -> Dict[AgentType, Type["Agent"]]:
+    """ADK agent class used for each `AgentType`; anything else falls back to `Agent`."""
+
+    from google.adk.agents import LlmAgent, ParallelAgent, SequentialAgent
+
+    return {
+        AgentType.LLM_AGENT: LlmAgent,
+        AgentType.PARALLEL_AGENT: ParallelAgent,
+        AgentType.SEQUENTIAL_AGENT: SequentialAgent,
+    }
+
 
 class BaseAgent(abc.ABC):
     """Base class for all agents.
@@ -49,8 +79,13 @@ class BaseAgent(abc.ABC):
     - Provide `input_schema` / `output_schema` via `super().__init__`.
     - Optionally override `_create_input_from_request` for custom input
       mapping.
+    - Optionally set `response_cache_ttl` (seconds) if the agent's output
+      depends only on its input, so repeated requests skip the LLM call.
+      Turns served from the cache are not recorded in the session history.
     """
 
+    response_cache_ttl: Optional[float] = None
+
     def __init__(
         self,
         agent_config: Optional[AgentConfig] = None,
@@ -60,6 +95,8 @@ class BaseAgent(abc.ABC):
         config_path: Optional[str] = None,
         _caller_file: Optional[str] = None,
     ) -> None:
+        _load_dotenv_once()
+
         # 1) Load configuration
         self.agent_config: AgentConfig = load_agent_config(
             agent_config=agent_config,
@@ -72,23 +109,29 @@ class BaseAgent(abc.ABC):
         self.agent_type: Optional[AgentType] = agent_type
         self.input_schema: Type[BaseModel] = input_schema or TextInput
         self.output_schema: Type[BaseModel] = output_schema or TextOutput
+        self._build_input = get_input_builder(self.input_schema)
+        self._response_cache = ResponseCache(self.response_cache_ttl) if self.response_cache_ttl else None
 
         # 3) Modular components for configuration & sessions
         self.agent_configurator = AgentConfigurator(self.agent_config)
+        # Config values are fixed for the agent's lifetime, so resolve them once
+        # (this also shares a single LiteLlm instance across agent and parser)
+        self._agent_name = self.agent_configurator.get_agent_name()
+        self._agent_description = self.agent_configurator.get_agent_description()
+        self._instruction_template = self.agent_configurator.get_instruction_template()
+        self._agent_model = self.agent_configurator.get_model()
+
         self.session_service, self._use_database_sessions = SessionServiceFactory.create_session_service(
-            self.agent_configurator.get_agent_name()
+            self._agent_name
         )
         self.session_manager = SessionManager(
             self.session_service,
-            self.agent_configurator.get_agent_name(),
+            self._agent_name,
             self._use_database_sessions,
         )
-        self.response_parser = ResponseParser(self.agent_configurator.get_model())
-
-        # 4) Observability (Opik)
-        self.observer = create_observer(self.agent_config)
+        self.response_parser = ResponseParser(self._agent_model)
 
-        # 5) Create underlying ADK agent and runner
+        # 4) Create underlying ADK agent (and its Opik observer) and runner
         self._setup_agent()
         self._setup_runner()
 
@@ -97,19 +140,19 @@ class BaseAgent(abc.ABC):
     # ------------------------------------------------------------------
 
     def _get_agent_name(self) -> str:
-        return self.agent_configurator.get_agent_name()
+        return self._agent_name
 
     def _get_agent_description(self) -> str:
-        return self.agent_configurator.get_agent_description()
+        return self._agent_description
 
     def _get_instruction_template(self) -> str:
-        return self.agent_configurator.get_instruction_template()
+        return self._instruction_template
 
-    def _get_model(self) -> LiteLlm:
-        return self.agent_configurator.get_model()
+    def _get_model(self) -> "LiteLlm":
+        return self._agent_model
 
     def _get_agent_config(self) -> AgentConfig:
-        return self.agent_configurator.get_agent_config()
+        return self.agent_config
 
     # ------------------------------------------------------------------
     # Agent + runner construction
@@ -120,11 +163,19 @@ class BaseAgent(abc.ABC):
 
         logger.info("Setting up agent: %s", self.agent_config)
 
-        tools = self._create_tools()
-        logger.info("Created %d tools for agent: %s", len(tools), self._get_agent_name())
+        # The first observer in a process configures the Opik client, so set it
+        # up in a worker thread while tools and sub-agents are constructed
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-observer") as executor:
+            observer_future = executor.submit(create_observer, self.agent_config)
+
+            tools = self._create_tools()
+            logger.info("Created %d tools for agent: %s", len(tools), self._get_agent_name())
 
-        sub_agents = self._create_sub_agents()
-        logger.info("Created %d sub-agents for agent: %s", len(sub_agents), self._get_agent_name())
+            sub_agents = self._create_sub_agents()
+            logger.info("Created %d sub-agents for agent: %s", len(sub_agents), self._get_agent_name())
+
+            self.observer = observer_future.result()
+        self._observer_kwargs: Dict[str, Any] = observer_callback_kwargs(self.observer) if self.observer else {}
 
         agent_kwargs: dict[str, Any] = {
             "model": self._get_model(),
@@ -138,32 +189,20 @@ class BaseAgent(abc.ABC):
         }
 
         # Attach observability callbacks if available
-        if self.observer:
-            agent_kwargs.update(
-                {
-                    "before_agent_callback": self.observer.before_agent_callback,
-                    "after_agent_callback": self.observer.after_agent_callback,
-                    "before_model_callback": self.observer.before_model_callback,
-                    "after_model_callback": self.observer.after_model_callback,
-                    "before_tool_callback": self.observer.before_tool_callback,
-                    "after_tool_callback": self.observer.after_tool_callback,
-                }
-            )
+        if self._observer_kwargs:
+            agent_kwargs.update(self._observer_kwargs)
         else:
             logger.warning("No observability observer available - tracing will be disabled")
 
-        self.agent: Agent = self._create_agent_from_type(agent_kwargs)
+        self.agent: "Agent" = self._create_agent_from_type(agent_kwargs)
 
-    def _create_agent_from_type(self, agent_kwargs: dict[str, Any]) -> Agent:
+    def _create_agent_from_type(self, agent_kwargs: dict[str, Any]) -> "Agent":
         """Instantiate the concrete ADK agent based on `agent_type`."""
 
-        if self._get_agent_type() == AgentType.LLM_AGENT:
-            return LlmAgent(**agent_kwargs)
-        if self._get_agent_type() == AgentType.PARALLEL_AGENT:
-            return ParallelAgent(**agent_kwargs)
-        if self._get_agent_type() == AgentType.SEQUENTIAL_AGENT:
-            return SequentialAgent(**agent_kwargs)
-        return Agent(**agent_kwargs)
+        from google.adk import Agent
+
+        agent_cls = _agent_classes_by_type().get(self._get_agent_type(), Agent)
+        return agent_cls(**agent_kwargs)
 
     def _get_agent_type(self) -> Optional[AgentType]:
         return self.agent_type
@@ -171,6 +210,8 @@ class BaseAgent(abc.ABC):
     def _setup_runner(self) -> None:
         """Setup the Google ADK runner."""
 
+        from google.adk.runners import Runner
+
         logger.info("Setting up runner for agent: %s", self._get_agent_name())
         self.runner = Runner(
             agent=self.agent,
@@ -178,6 +219,12 @@ class BaseAgent(abc.ABC):
             session_service=self.session_service,
         )
 
+        # Bounds how many runs of this agent wait on the LLM at once; a
+        # burst beyond `max_concurrency` queues here instead of piling onto
+        # the provider's rate limits
+        max_concurrency = getattr(self.agent_config, "max_concurrency", None)
+        self._run_slots = asyncio.Semaphore(max_concurrency) if max_concurrency else contextlib.nullcontext()
+
     # ------------------------------------------------------------------
     # Public run + chat API
     # ------------------------------------------------------------------
@@ -185,33 +232,77 @@ class BaseAgent(abc.ABC):
     async def run(self, user_id: str, session_id: str, input_data: BaseModel) -> BaseModel:
         """Run the agent with schema validation handled by ADK."""
 
-        logger.info("Running agent: %s", self._get_agent_name())
+        logger.debug("Running agent: %s", self._agent_name)
         logger.debug("Using session ID: %s", session_id)
 
         await self.session_manager.ensure_session_exists(user_id, session_id)
 
-        input_text = input_data.model_dump_json()
-        content = types.Content(role="user", parts=[types.Part(text=input_text)])
+        content = create_user_content(input_data)
 
-        result_generator = self.runner.run(
-            user_id=user_id,
-            session_id=session_id,
-            new_message=content,
-        )
-
-        result = None
-        for response in result_generator:
-            if (
-                hasattr(response, "content")
-                and response.content
-                and response.content.parts
-                and response.content.parts[0].text
-            ):
-                result = response
+        async with self._run_slots:
+            try:
+                result = await self._run_until_final_response(user_id, session_id, content)
+            except Exception as error:
+                if not is_session_not_found_error(error):
+                    raise
+                # Deleted or expired in the session service since we last saw it
+                logger.info("Session %s no longer exists, recreating it", session_id)
+                self.session_manager.forget_session(user_id, session_id)
+                await self.session_manager.ensure_session_exists(user_id, session_id)
+                result = await self._run_until_final_response(user_id, session_id, content)
 
         logger.debug("Result: %s", result)
         return self._parse_agent_response(result)
 
+    async def _run_with_cache(self, user_id: str, session_id: str, input_data: BaseModel) -> BaseModel:
+        """`run()` behind the response cache, if the agent enables one.
+
+        A cache hit skips the runner entirely, so that turn is not recorded
+        in the session history. Callers get their own deep copy of the
+        cached output, since output schemas are mutable.
+        """
+
+        if self._response_cache is None:
+            return await self.run(user_id, session_id, input_data)
+
+        cache_key = (user_id, input_data.__pydantic_serializer__.to_json(input_data))
+        result = self._response_cache.get(cache_key)
+        if result is not None:
+            logger.debug("Response cache hit for agent: %s", self._agent_name)
+            return result.model_copy(deep=True)
+
+        result = await self.run(user_id, session_id, input_data)
+        self._response_cache.set(cache_key, result.model_copy(deep=True))
+        return result
+
+    async def _run_until_final_response(self, user_id: str, session_id: str, new_message: "types.Content") -> Any:
+        """Drive the async runner and return the last event carrying text.
+
+        Stops early at a final response authored by this agent itself.
+        Sequential and parallel agents yield a final response from each
+        sub-agent, so those only end the turn once the runner is exhausted.
+
+        `Runner.run_async` awaits the model on the caller's event loop, so
+        concurrent requests overlap without a worker thread each (the sync
+        `Runner.run` spins up its own thread and loop per call).
+        """
+
+        result = None
+        events = self.runner.run_async(user_id=user_id, session_id=session_id, new_message=new_message)
+        # aclosing() finalizes the runner's generator promptly if we stop early
+        async with contextlib.aclosing(events):
+            async for response in events:
+                content = getattr(response, "content", None)
+                if content and content.parts and content.parts[0].text:
+                    result = response
+                    # Our own final response ends the turn; don't drain trailing bookkeeping events
+                    if getattr(response, "author", None) != self.agent.name:
+                        continue
+                    is_final_response = getattr(response, "is_final_response", None)
+                    if is_final_response is not None and is_final_response():
+                        break
+        return result
+
     def _parse_agent_response(self, result) -> BaseModel:
         """Parse the agent response according to the output schema."""
 
@@ -225,10 +316,43 @@ class BaseAgent(abc.ABC):
         """Create input schema instance from `AgentChatRequest`.
 
         Subclasses may override this for custom input transformation. The
-        default implementation delegates to `core.io.create_input_from_request`.
+        default implementation uses the builder compiled for `input_schema`
+        by `core.io.get_input_builder`.
+        """
+
+        return self._build_input(request.query)
+
+    @staticmethod
+    def _features_to_dict(features: Optional[List[FeatureMap]]) -> Dict[str, Any]:
+        """Index request features by name.
+
+        Agents that read several features should build this once per
+        request rather than scanning `request.features` for each lookup,
+        e.g. ``self._features_to_dict(request.features).get("limit", 5)``.
         """
 
-        return create_input_from_request(self.input_schema, request)
+        return {feature.feature_name: feature.feature_value for feature in features or ()}
+
+    @staticmethod
+    def _feature(
+        features: Optional[List[FeatureMap]],
+        name: str,
+        default: Any,
+        cap: Optional[Any] = None,
+    ) -> Any:
+        """Read a single feature value, falling back to `default`.
+
+        If `cap` is given the value is clamped to at most `cap`. For several
+        lookups on the same request, build `_features_to_dict` once instead.
+        """
+
+        # Scan from the end and stop at the first match: the same "last one
+        # wins" result as `_features_to_dict`, without building the dict
+        value = next(
+            (feature.feature_value for feature in reversed(features or ()) if feature.feature_name == name),
+            default,
+        )
+        return min(value, cap) if cap is not None else value
 
     async def chat(self, request: AgentChatRequest) -> AgentChatResponse:
         """Default chat implementation.
@@ -239,30 +363,32 @@ class BaseAgent(abc.ABC):
         3. Wrap the result in `AgentChatResponse` with basic error handling.
         """
 
-        logger.debug("Chatting with the agent: %s", self._get_agent_name())
+        logger.debug("Chatting with the agent: %s", self._agent_name)
 
         try:
             input_data = self._create_input_from_request(request)
 
-            result = await self.run(
+            result = await self._run_with_cache(
                 request.user_id,
                 request.session_id,
                 input_data,
             )
 
-            logger.info("Result from %s: %s", self._get_agent_name(), result)
+            logger.debug("Result from %s: %s", self._agent_name, result)
 
-            return AgentChatResponse(
-                agent_name=self._get_agent_name(),
+            # Every field comes from the validated request or our own parsing,
+            # so skip revalidating them on the happy path
+            return AgentChatResponse.model_construct(
+                agent_name=self._agent_name,
                 user_id=request.user_id,
                 session_id=request.session_id,
                 success=True,
                 agent_response=result,
             )
         except Exception as exc:  # pragma: no cover - defensive
-            logger.error("Error in %s: %s", self._get_agent_name(), exc, exc_info=True)
+            logger.error("Error in %s: %s", self._agent_name, exc, exc_info=True)
             return AgentChatResponse(
-                agent_name=self._get_agent_name(),
+                agent_name=self._agent_name,
                 user_id=request.user_id,
                 session_id=request.session_id,
                 success=False,
@@ -279,7 +405,7 @@ class BaseAgent(abc.ABC):
 
         return build_tools_from_config(self.agent_config)
 
-    def _create_sub_agents(self) -> List[Agent]:
+    def _create_sub_agents(self) -> List["Agent"]:
         """Create sub-agents for the agent.
 
         The default implementation returns an empty list; subclasses can
@@ -304,33 +430,34 @@ class BaseAgent(abc.ABC):
         - {"type": "content", "agent": "...", "text": "..."}
         - {"type": "done"}
         """
-        logger.info("Starting streaming run for agent: %s", self._get_agent_name())
+        logger.debug("Starting streaming run for agent: %s", self._agent_name)
 
         await self.session_manager.ensure_session_exists(user_id, session_id)
 
-        input_text = input_data.model_dump_json()
-        content = types.Content(role="user", parts=[types.Part(text=input_text)])
+        content = create_user_content(input_data)
 
         # Emit "thinking" event to indicate processing started
         yield {
             "type": "thinking",
-            "agent": self._get_agent_name(),
+            "agent": self._agent_name,
             "message": "Processing your request...",
         }
 
-        # ADK Runner.run() returns a generator with events
+        # ADK Runner.run_async() yields events as they are produced without
+        # blocking the event loop (Runner.run() waits on a thread queue), so
+        # each event can be flushed to the client as soon as it arrives.
         try:
-            result_generator = self.runner.run(
+            result_generator = self.runner.run_async(
                 user_id=user_id,
                 session_id=session_id,
                 new_message=content,
             )
-            logger.info("Runner.run() returned generator, starting to iterate...")
+            logger.debug("Runner.run_async() returned generator, starting to iterate...")
         except Exception as e:
-            logger.error(f"Failed to create runner generator: {e}", exc_info=True)
+            logger.error("Failed to create runner generator: %s", e, exc_info=True)
             yield {
                 "type": "error",
-                "agent": self._get_agent_name(),
+                "agent": self._agent_name,
                 "message": f"Failed to start agent: {str(e)}",
             }
             return
@@ -341,37 +468,43 @@ class BaseAgent(abc.ABC):
 
         # Iterate through all events from the runner
         try:
-            for event in result_generator:
+            async for event in result_generator:
                 event_count += 1
-                logger.info(f"Received event #{event_count} from runner: {type(event).__name__}")
+                logger.debug("Received event #%d from runner: %s", event_count, type(event).__name__)
                 
                 stream_events = self._format_stream_event(event)
-                logger.info(f"Formatted {len(stream_events)} stream events from event #{event_count}")
+                logger.debug("Formatted %d stream events from event #%d", len(stream_events), event_count)
                 
                 if not stream_events:
                     # If no stream events were generated, log why
                     if not hasattr(event, "content"):
-                        logger.warning(f"Event #{event_count} has no 'content' attribute. Event type: {type(event)}, dir: {[a for a in dir(event) if not a.startswith('_')][:10]}")
+                        logger.warning(
+                            "Event #%d has no 'content' attribute. Event type: %s, dir: %s",
+                            event_count, type(event), [a for a in dir(event) if not a.startswith('_')][:10],
+                        )
                     elif not event.content:
-                        logger.warning(f"Event #{event_count} has empty 'content'")
+                        logger.warning("Event #%d has empty 'content'", event_count)
                     elif not hasattr(event.content, "parts") or not event.content.parts:
-                        logger.warning(f"Event #{event_count} has content but no parts")
+                        logger.warning("Event #%d has content but no parts", event_count)
                     else:
-                        logger.warning(f"Event #{event_count} has {len(event.content.parts)} parts but none were processed")
+                        logger.warning("Event #%d has %d parts but none were processed", event_count, len(event.content.parts))
                 
                 for stream_event in stream_events:
                     if stream_event["type"] == "content":
                         last_content_event = stream_event
-                        content_text = stream_event.get("text", "")
-                        logger.info(f"Yielding content event: text_length={len(str(content_text))}, preview={str(content_text)[:100] if content_text else 'EMPTY'}")
+                        content_text = str(stream_event.get("text") or "")
+                        logger.debug("Yielding content event: text_length=%d, preview=%s", len(content_text), content_text[:100] or 'EMPTY')
                     yield stream_event
 
-            logger.info(f"Finished processing {event_count} events from runner")
+            logger.debug("Finished processing %d events from runner", event_count)
         except Exception as e:
-            logger.error(f"Error while processing runner events: {e}", exc_info=True)
+            logger.error("Error while processing runner events: %s", e, exc_info=True)
+            if is_session_not_found_error(e):
+                # Recreate the session on the next turn instead of failing every one
+                self.session_manager.forget_session(user_id, session_id)
             yield {
                 "type": "error",
-                "agent": self._get_agent_name(),
+                "agent": self._agent_name,
                 "message": f"Error processing events: {str(e)}",
             }
         
@@ -385,10 +518,11 @@ class BaseAgent(abc.ABC):
         events = []
 
         if not hasattr(event, "content") or not event.content:
-            logger.debug(f"Event has no content: {type(event)}, attributes: {dir(event) if hasattr(event, '__dict__') else 'N/A'}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Event has no content: %s, attributes: %s", type(event), dir(event) if hasattr(event, '__dict__') else 'N/A')
             return events
 
-        author = getattr(event, "author", self._get_agent_name())
+        author = getattr(event, "author", self._agent_name)
 
         # Check each part of the content
         for part in event.content.parts if event.content.parts else []:
@@ -418,7 +552,7 @@ class BaseAgent(abc.ABC):
             # Text content
             elif hasattr(part, "text"):
                 text_value = part.text if part.text else ""
-                logger.info(f"Found text part: has_text={bool(part.text)}, text_length={len(str(text_value))}, preview={str(text_value)[:100] if text_value else 'EMPTY'}")
+                logger.debug("Found text part: has_text=%s, text_length=%d, preview=%s", bool(text_value), len(text_value), text_value[:100] or 'EMPTY')
                 if text_value:
                     events.append({
                         "type": "content",
@@ -426,7 +560,7 @@ class BaseAgent(abc.ABC):
                         "text": text_value,
                     })
                 else:
-                    logger.warning(f"Text part exists but is empty or None")
+                    logger.warning("Text part exists but is empty or None")
 
         return events
 
@@ -438,7 +572,7 @@ class BaseAgent(abc.ABC):
         This is the streaming equivalent of chat(). Use this for real-time
         updates showing tool calls, thinking states, and progressive responses.
         """
-        logger.debug("Starting streaming chat with agent: %s", self._get_agent_name())
+        logger.debug("Starting streaming chat with agent: %s", self._agent_name)
 
         try:
             input_data = self._create_input_from_request(request)
@@ -454,6 +588,6 @@ class BaseAgent(abc.ABC):
             logger.error("Streaming chat error: %s", exc, exc_info=True)
             yield {
                 "type": "error",
-                "agent": self._get_agent_name(),
+                "agent": self._agent_name,
                 "message": str(exc),
             }
@@ -0,0 +1,39 @@
+"""Response caching for agents whose output depends only on their input.
+
+Agents opt in by setting `BaseAgent.response_cache_ttl`. Entries live in a
+bounded per-agent, per-process structure and are evicted oldest-first or once
+they are older than the TTL.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+MAX_CACHED_RESPONSES = 1024
+
+
+class ResponseCache:
+    """Bounded TTL cache mapping a request key to a parsed agent result."""
+
+    def __init__(self, ttl: float, max_entries: int = MAX_CACHED_RESPONSES):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached result for `key`, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -5,13 +5,35 @@ This wraps the logic for loading `AgentConfig` from YAML, including the
 handled inline.
 """
 
-import inspect
 import os
-from typing import Optional
+import sys
+from typing import Dict, Optional, Tuple
 
 from src.agents.configs.agent_config import AgentConfig
 from src.agents.utils.path_utils import resolve_config_path
 
+# Parsed configs keyed by absolute YAML path. The file mtime is stored with each
+# entry so edits made during development are picked up without a restart.
+_CONFIG_CACHE: Dict[str, Tuple[int, AgentConfig]] = {}
+
+
+def _load_cached_config(config_path: str) -> AgentConfig:
+    """Load an `AgentConfig` from YAML, reusing the parsed result while the file is unchanged."""
+    key = os.path.abspath(config_path)
+    try:
+        mtime = os.stat(key).st_mtime_ns
+    except OSError:
+        # Let AgentConfig.from_yaml raise its usual FileNotFoundError
+        return AgentConfig.from_yaml(key)
+
+    hit = _CONFIG_CACHE.get(key)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+
+    agent_config = AgentConfig.from_yaml(key)
+    _CONFIG_CACHE[key] = (mtime, agent_config)
+    return agent_config
+
 
 def load_agent_config(
     agent_config: Optional[AgentConfig] = None,
@@ -37,29 +59,21 @@ def load_agent_config(
         if caller_file:
             config_path = resolve_config_path(relative_to=caller_file)
         else:
-            # Fallback: attempt to infer from the call stack
+            # Fallback: infer from the caller's module globals. sys._getframe is
+            # much cheaper than inspect.currentframe() and returns the caller directly.
             try:
-                frame = inspect.currentframe()
-                caller_frame = frame.f_back if frame else None
-                if caller_frame:
-                    caller_file_stack = caller_frame.f_globals.get("__file__")
-                    if caller_file_stack:
-                        config_path = resolve_config_path(relative_to=caller_file_stack)
-                    else:
-                        raise ValueError(
-                            "Cannot auto-detect config file. Please provide one of: "
-                            "agent_config, config_path, or _caller_file=__file__"
-                        )
-                if frame is not None:
-                    del frame
-            except Exception as e:  # pragma: no cover - defensive
+                caller_file_stack = sys._getframe(1).f_globals.get("__file__")
+            except ValueError:  # pragma: no cover - call stack not deep enough
+                caller_file_stack = None
+            if not caller_file_stack:
                 raise ValueError(
-                    f"Cannot auto-detect config file: {e}. "
-                    "Please provide one of: agent_config, config_path, or _caller_file=__file__"
+                    "Cannot auto-detect config file. Please provide one of: "
+                    "agent_config, config_path, or _caller_file=__file__"
                 )
+            config_path = resolve_config_path(relative_to=caller_file_stack)
 
     if not config_path:
         raise ValueError("Config path could not be resolved.")
 
     # AgentConfig.from_yaml already normalises and validates the path
-    return AgentConfig.from_yaml(config_path)
+    return _load_cached_config(config_path)
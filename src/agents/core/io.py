@@ -1,68 +1,115 @@
 """Input/output helpers for BaseAgent."""
 
-import json
+import functools
 import logging
-from typing import Type
+from typing import TYPE_CHECKING, Any, Callable, Optional, Type
 
 from pydantic import BaseModel
 
 from src.models.base_models import AgentChatRequest
 
+if TYPE_CHECKING:
+    from google.genai import types
+
 logger = logging.getLogger(__name__)
 
 
+class AgentResponseParseError(ValueError):
+    """The runner's final response could not be parsed as the agent's `output_schema`.
+
+    `content_text` holds the raw model output, if there was any.
+    """
+
+    def __init__(self, message: str, content_text: Optional[str] = None):
+        super().__init__(message)
+        self.content_text = content_text
+
+
+@functools.lru_cache(maxsize=None)
+def get_input_builder(input_schema: Type[BaseModel]) -> Callable[[Any], BaseModel]:
+    """Return a function that turns a request `query` into `input_schema`.
+
+    The schema's fields are inspected once and the matching fallback branch is
+    baked into the returned closure, so per-request work is just the dict
+    check and the (validated) model construction.
+    """
+
+    fields = tuple(getattr(input_schema, "model_fields", {}))
+
+    if "text" in fields:
+        # Strings and other non-dict queries go into the 'text' field
+        def from_value(query: Any) -> BaseModel:
+            return input_schema(text=str(query))
+    elif fields:
+        first_field = fields[0]
+
+        # Otherwise use the first declared field
+        def from_value(query: Any) -> BaseModel:
+            return input_schema(**{first_field: query})
+    else:
+        # Last resort: try to pass query directly
+        def from_value(query: Any) -> BaseModel:
+            return input_schema(query) if query else input_schema()
+
+    def build(query: Any) -> BaseModel:
+        # If query is a dict, validate it as the schema's fields directly
+        # (no kwargs unpacking; pydantic-core walks the dict in one call)
+        if isinstance(query, dict):
+            try:
+                return input_schema.model_validate(query)
+            except (TypeError, ValueError) as exc:
+                logger.warning("Failed to create input from dict, trying with 'text' field: %s", exc)
+        return from_value(query)
+
+    return build
+
+
 def create_input_from_request(input_schema: Type[BaseModel], request: AgentChatRequest) -> BaseModel:
     """Default logic for turning an `AgentChatRequest` into an input schema.
 
     Behaviour is unchanged from the previous BaseAgent implementation:
-    - If `query` is a dict, try to unpack as kwargs into the schema.
+    - If `query` is a dict, try to validate it as the schema's fields.
     - Otherwise, try `text` field.
     - Otherwise, try first field.
     - Finally, fall back to passing the raw query.
     """
 
-    query = request.query
+    return get_input_builder(input_schema)(request.query)
 
-    # If query is a dict, try to use it as kwargs
-    if isinstance(query, dict):
-        try:
-            return input_schema(**query)
-        except (TypeError, ValueError) as exc:
-            logger.warning("Failed to create input from dict, trying with 'text' field: %s", exc)
-            if hasattr(input_schema, "model_fields") and "text" in input_schema.model_fields:
-                return input_schema(text=str(query))
 
-    # If query is a string or other type, try 'text' field first
-    if hasattr(input_schema, "model_fields"):
-        if "text" in input_schema.model_fields:
-            return input_schema(text=str(query))
-        fields = list(input_schema.model_fields.keys())
-        if fields:
-            return input_schema(**{fields[0]: query})
+def create_user_content(input_data: BaseModel) -> "types.Content":
+    """Wrap an input schema instance as the user message sent to the ADK runner.
+
+    Serializes through the model's compiled pydantic-core serializer directly,
+    skipping the Python-level `model_dump_json` wrapper.
+    """
+
+    from google.genai import types
 
-    # Last resort: try to pass query directly
-    return input_schema(query) if query else input_schema()
+    input_text = input_data.__pydantic_serializer__.to_json(input_data).decode()
+    # Build a fresh message per call: the runner stores it as the user event in
+    # the session, so a shared template would be rewritten under concurrent turns
+    return types.Content(role="user", parts=[types.Part(text=input_text)])
 
 
 def parse_agent_response(output_schema: Type[BaseModel], result) -> BaseModel:
-    """Parse the ADK event into an `output_schema` instance or a raw value.
+    """Parse the ADK event into an `output_schema` instance.
 
-    This mirrors the previous `_parse_agent_response` logic.
+    Raises `AgentResponseParseError` if the event has no text or the text
+    doesn't validate against `output_schema`.
     """
 
     logger.debug("Parsing agent response: %s", result)
     if not (result and hasattr(result, "content") and result.content and result.content.parts):
-        logger.error("No valid content found in the response")
-        return None
+        raise AgentResponseParseError("No valid content found in the response")
 
     content_text = result.content.parts[0].text
 
     try:
         logger.debug("Parsing agent response text: %s", content_text)
-        parsed_data = json.loads(content_text)
-        logger.debug("Parsed data: %s", parsed_data)
-        return output_schema(**parsed_data)
-    except (json.JSONDecodeError, TypeError, ValueError) as exc:
-        logger.error("Failed to parse output: %s", exc)
-        # Fallback: return the raw content
-        return content_text
+        # Parse and validate in one pass in pydantic-core, without an intermediate dict
+        return output_schema.model_validate_json(content_text)
+    except (TypeError, ValueError) as exc:
+        raise AgentResponseParseError(
+            f"Failed to parse output as {output_schema.__name__}: {exc}", content_text
+        ) from exc
@@ -1,16 +1,31 @@
 """Observability helpers (Opik integration)."""
 
+import functools
 import logging
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from src.agents.configs.agent_config import AgentConfig
-from src.agents.observability.opik import OpikObserver
+
+if TYPE_CHECKING:
+    from src.agents.observability.opik import OpikObserver
 
 logger = logging.getLogger(__name__)
 
+# Observers keyed by the values that end up on the Opik tracer (name, tags,
+# model). Agents built more than once with the same config - e.g. a sub-agent
+# that is also registered on its own - reuse one tracer instead of
+# initializing another Opik client.
+_OBSERVER_CACHE: Dict[Tuple, "OpikObserver"] = {}
+_OBSERVER_LOCK = threading.Lock()
+
+
+def _observer_key(agent_config: AgentConfig) -> Tuple:
+    return (agent_config.agent_name, tuple(agent_config.tags or ()), agent_config.model.value)
 
-def create_observer(agent_config: AgentConfig) -> Optional[OpikObserver]:
-    """Create an OpikObserver for the given agent config.
+
+def create_observer(agent_config: AgentConfig) -> Optional["OpikObserver"]:
+    """Create (or reuse) an OpikObserver for the given agent config.
 
     If observer creation fails (e.g. missing env vars), a warning is logged
     and `None` is returned, allowing the framework to continue without
@@ -18,7 +33,35 @@ def create_observer(agent_config: AgentConfig) -> Optional[OpikObserver]:
     """
 
     try:
-        return OpikObserver(agent_config=agent_config)
+        # Lazy import: importing opik configures the client, so only pay for
+        # it once an agent is actually built
+        from src.agents.observability.opik import OpikObserver
+
+        key = _observer_key(agent_config)
+        with _OBSERVER_LOCK:
+            observer = _OBSERVER_CACHE.get(key)
+            if observer is None:
+                observer = OpikObserver(agent_config=agent_config)
+                _OBSERVER_CACHE[key] = observer
+        return observer
     except Exception as exc:  # pragma: no cover - defensive
         logger.error("Failed to setup observability: %s", exc)
         return None
+
+
+@functools.lru_cache(maxsize=None)
+def observer_callback_kwargs(observer: "OpikObserver") -> Dict[str, Any]:
+    """ADK agent callback kwargs for an observer, built once per observer.
+
+    Treat the returned dict as read-only; it is shared by every agent using
+    the same observer.
+    """
+
+    return {
+        "before_agent_callback": observer.before_agent_callback,
+        "after_agent_callback": observer.after_agent_callback,
+        "before_model_callback": observer.before_model_callback,
+        "after_model_callback": observer.after_model_callback,
+        "before_tool_callback": observer.before_tool_callback,
+        "after_tool_callback": observer.after_tool_callback,
+    }
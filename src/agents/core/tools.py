@@ -7,7 +7,8 @@ instances.
 
 import importlib
 import logging
-from typing import Any, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List
 
 from google.adk.tools import FunctionTool, AgentTool
 
@@ -34,6 +35,35 @@ def _import_string(dotted_path: str) -> Any:
         raise ImportError(f"Module '{module_path}' has no attribute '{attr_name}'") from exc
 
 
+def _create_agent(agent_class_path: str) -> Any:
+    """Import and instantiate the agent class used by an ``agent`` tool."""
+
+    return _import_string(agent_class_path)()
+
+
+def _construct_agent_tools(tools_config: List[Dict[str, Any]]) -> Dict[int, Future]:
+    """Construct all ``agent`` tool instances concurrently.
+
+    Each sub-agent loads its YAML config and wires up its own model, session
+    service and runner, all independent of its siblings and mostly I/O bound,
+    so building them in threads cuts agent-tree construction from the sum of
+    their init times to roughly the slowest one. Returns completed futures
+    keyed by the tool's index in ``tools_config``, so construction errors are
+    raised (and handled) per tool when the result is read.
+    """
+
+    agent_paths = {
+        index: cfg.get("agent_class")
+        for index, cfg in enumerate(tools_config)
+        if isinstance(cfg, dict) and cfg.get("type") == "agent" and cfg.get("agent_class")
+    }
+    if not agent_paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(agent_paths), thread_name_prefix="agent-tool") as executor:
+        return {index: executor.submit(_create_agent, path) for index, path in agent_paths.items()}
+
+
 def build_tools_from_config(agent_config: AgentConfig) -> List[FunctionTool]:
     """Build tools for an agent from its YAML configuration.
 
@@ -54,8 +84,9 @@ def build_tools_from_config(agent_config: AgentConfig) -> List[FunctionTool]:
         return []
 
     tools: List[FunctionTool] = []
+    agent_futures = _construct_agent_tools(tools_config)
 
-    for cfg in tools_config:
+    for index, cfg in enumerate(tools_config):
         try:
             cfg_type = cfg.get("type")
 
@@ -86,7 +117,7 @@ def build_tools_from_config(agent_config: AgentConfig) -> List[FunctionTool]:
                     # If the object has to_function_tool method, use it to get proper name/description
                     if hasattr(target_obj, 'to_function_tool') and callable(getattr(target_obj, 'to_function_tool')):
                         tool = target_obj.to_function_tool()
-                        logger.info(f"Registered tool '{target_obj.tool_name}' with description: {target_obj.tool_description[:100]}...")
+                        logger.info("Registered tool '%s' with description: %s...", target_obj.tool_name, target_obj.tool_description[:100])
                         tools.append(tool)
                     else:
                         tools.append(FunctionTool(func))
@@ -110,8 +141,7 @@ def build_tools_from_config(agent_config: AgentConfig) -> List[FunctionTool]:
                     )
                     continue
 
-                agent_cls = _import_string(agent_class_path)
-                agent_instance = agent_cls()
+                agent_instance = agent_futures[index].result()
                 tools.append(AgentTool(agent_instance.agent))
 
             else:
@@ -1,12 +1,28 @@
 """Agent configuration module for BaseAgent."""
 
+import functools
 import logging
+from typing import TYPE_CHECKING
 from src.agents.configs.agent_config import AgentConfig
-from google.adk.models.lite_llm import LiteLlm
+
+if TYPE_CHECKING:
+    from google.adk.models.lite_llm import LiteLlm
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _lite_llm(model_name: str) -> "LiteLlm":
+    """Shared `LiteLlm` per model name.
+
+    `LiteLlm` only wraps the model name around litellm's module-level client,
+    so agents (and sub-agents) on the same model can reuse one instance.
+    """
+    from google.adk.models.lite_llm import LiteLlm
+
+    return LiteLlm(model_name)
+
+
 class AgentConfigurator:
     """Handles agent configuration and setup."""
     
@@ -20,25 +36,25 @@ class AgentConfigurator:
         
     def get_agent_name(self) -> str:
         """Get the name of the agent."""
-        logger.info(f"Getting agent name: {self.agent_config.agent_name}")
+        logger.debug("Getting agent name: %s", self.agent_config.agent_name)
         return self.agent_config.agent_name
     
     def get_agent_description(self) -> str:
         """Get the description of the agent."""
-        logger.info(f"Getting description: {self.agent_config.description}")
+        logger.debug("Getting description: %s", self.agent_config.description)
         return self.agent_config.description
 
     def get_instruction_template(self) -> str:
         """Get the instruction template of the agent."""
-        logger.info(f"Getting instruction template: {self.agent_config.instruction_template}")
+        logger.debug("Getting instruction template: %s", self.agent_config.instruction_template)
         return self.agent_config.instruction_template
 
-    def get_model(self) -> LiteLlm:
+    def get_model(self) -> "LiteLlm":
         """Get the model of the agent."""
-        logger.info(f"Getting model: {self.agent_config.model.value}")
-        return LiteLlm(self.agent_config.model.value)
+        logger.debug("Getting model: %s", self.agent_config.model.value)
+        return _lite_llm(self.agent_config.model.value)
     
     def get_agent_config(self) -> AgentConfig:
         """Get the configuration of the agent."""
-        logger.info(f"Getting agent config: {self.agent_config}")
+        logger.debug("Getting agent config: %s", self.agent_config)
         return self.agent_config
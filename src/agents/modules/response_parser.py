@@ -1,8 +1,10 @@
 """Response parsing module for BaseAgent."""
 
 import logging
-from typing import Any, Dict, Optional
-from google.adk.models.lite_llm import LiteLlm
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from google.adk.models.lite_llm import LiteLlm
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +12,7 @@ logger = logging.getLogger(__name__)
 class ResponseParser:
     """Handles parsing and formatting of agent responses."""
     
-    def __init__(self, model: LiteLlm):
+    def __init__(self, model: "LiteLlm"):
         """Initialize the response parser.
         
         Args:
@@ -27,7 +29,7 @@ class ResponseParser:
         Returns:
             Parsed response dictionary
         """
-        logger.info(f"Parsing response: {response}")
+        logger.info("Parsing response: %s", response)
         
         # Handle different response types
         if isinstance(response, dict):
@@ -46,7 +48,7 @@ class ResponseParser:
         Returns:
             Formatted response string
         """
-        logger.info(f"Formatting response: {parsed_response}")
+        logger.info("Formatting response: %s", parsed_response)
         
         if "content" in parsed_response:
             return str(parsed_response["content"])
@@ -62,7 +64,7 @@ class ResponseParser:
         Returns:
             Metadata dictionary or None
         """
-        logger.info(f"Extracting metadata from response: {response}")
+        logger.info("Extracting metadata from response: %s", response)
         
         if isinstance(response, dict) and "metadata" in response:
             return response["metadata"]
@@ -1,16 +1,52 @@
 """Session management module for BaseAgent."""
 
+import asyncio
 import logging
-from typing import Union
-from google.adk.sessions import DatabaseSessionService, InMemorySessionService
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+
+if TYPE_CHECKING:
+    from google.adk.sessions import DatabaseSessionService, InMemorySessionService
+
+try:
+    # Typed duplicate-session error; older google-adk releases only raise the
+    # backend's own exception, which is matched on its message below
+    from google.adk.errors.already_exists_error import AlreadyExistsError
+except ImportError:  # pragma: no cover - depends on the installed google-adk
+    AlreadyExistsError = None
+
+try:
+    # Raised by the runner for a session the service no longer has; older
+    # releases raise a plain ValueError with the same message
+    from google.adk.errors.session_not_found_error import SessionNotFoundError
+except ImportError:  # pragma: no cover - depends on the installed google-adk
+    SessionNotFoundError = None
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on sessions remembered as already created (per agent)
+MAX_KNOWN_SESSIONS = 10000
+
+
+def _is_duplicate_session_error(error: Exception) -> bool:
+    """Whether `error` means the session being created already exists."""
+    if AlreadyExistsError is not None and isinstance(error, AlreadyExistsError):
+        return True
+    message = str(error).lower()
+    return "duplicate key" in message or "already exists" in message
+
+
+def is_session_not_found_error(error: Exception) -> bool:
+    """Whether `error` means the runner could not find the session."""
+    if SessionNotFoundError is not None and isinstance(error, SessionNotFoundError):
+        return True
+    return isinstance(error, ValueError) and "session not found" in str(error).lower()
+
 
 class SessionManager:
     """Manages session creation and retrieval for agents."""
     
-    def __init__(self, session_service: Union[DatabaseSessionService, InMemorySessionService], 
+    def __init__(self, session_service: Union["DatabaseSessionService", "InMemorySessionService"], 
                  agent_name: str, use_database_sessions: bool):
         """Initialize the session manager.
         
@@ -22,15 +58,59 @@ class SessionManager:
         self.session_service = session_service
         self.agent_name = agent_name
         self._use_database_sessions = use_database_sessions
+        # Sessions known to exist, so later turns skip the create round-trip,
+        # and in-flight creations shared by concurrent requests for the same session
+        self._known_sessions: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+        self._pending_sessions: Dict[Tuple[str, str], asyncio.Task] = {}
         
     async def ensure_session_exists(self, user_id: str, session_id: str) -> None:
         """Create session if it doesn't exist (handle duplicates gracefully).
         
+        Concurrent calls for the same session wait on a single creation, and
+        sessions already seen by this manager return immediately.
+        
         Args:
             user_id: User identifier
             session_id: Session identifier
         """
-        logger.info(f"Ensuring session exists: {session_id} for user: {user_id}")
+        key = (user_id, session_id)
+        if key in self._known_sessions:
+            self._known_sessions.move_to_end(key)
+            return
+        
+        pending = self._pending_sessions.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._create_session(user_id, session_id))
+            self._pending_sessions[key] = pending
+            pending.add_done_callback(lambda task: self._settle_pending(key, task))
+        # Shield so one cancelled request doesn't cancel the creation for the others
+        await asyncio.shield(pending)
+        
+        self._known_sessions[key] = None
+        while len(self._known_sessions) > MAX_KNOWN_SESSIONS:
+            self._known_sessions.popitem(last=False)
+    
+    def forget_session(self, user_id: str, session_id: str) -> None:
+        """Drop a session from the known set so the next call recreates it.
+        
+        For sessions deleted or expired in the session service without this
+        manager seeing it, e.g. when the runner reports the session missing.
+        """
+        self._known_sessions.pop((user_id, session_id), None)
+    
+    def _settle_pending(self, key: Tuple[str, str], task: asyncio.Task) -> None:
+        """Drop a finished creation and mark its exception as retrieved.
+        
+        Waiters re-raise the exception themselves, but if every waiter was
+        cancelled nobody reads it and asyncio would log it as never retrieved.
+        """
+        self._pending_sessions.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+    
+    async def _create_session(self, user_id: str, session_id: str) -> None:
+        """Create the session, treating an existing one as success."""
+        logger.debug("Ensuring session exists: %s for user: %s", session_id, user_id)
         
         # Try to create the session - if it already exists, that's fine
         try:
@@ -39,14 +119,12 @@ class SessionManager:
                 user_id=user_id,
                 session_id=session_id
             )
-            logger.info(f"Created new session: {session_id}")
+            logger.info("Created new session: %s", session_id)
         except Exception as create_error:
-            # If creation fails due to duplicate key, session already exists
-            if "duplicate key" in str(create_error).lower() or "already exists" in str(create_error).lower():
-                logger.info(f"Session already exists: {session_id} for user: {user_id}")
-            else:
-                logger.error(f"Failed to create session: {create_error}")
-                raise create_error
+            if not _is_duplicate_session_error(create_error):
+                logger.error("Failed to create session: %s", create_error)
+                raise
+            logger.info("Session already exists: %s for user: %s", session_id, user_id)
     
     def get_session_service(self):
         """Get the session service instance."""
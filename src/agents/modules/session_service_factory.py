@@ -2,18 +2,46 @@
 
 import os
 import logging
-from typing import Tuple, Union
-from google.adk.sessions import DatabaseSessionService, InMemorySessionService
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from google.adk.sessions import DatabaseSessionService, InMemorySessionService
 
 logger = logging.getLogger(__name__)
 
+# Recycle pooled database connections before managed Postgres/MySQL servers
+# (or proxies in front of them) drop them as idle
+SESSION_DB_POOL_RECYCLE_SECONDS = 1800
+
+
+def _engine_kwargs(session_store_uri: Optional[str]) -> Dict[str, Any]:
+    """SQLAlchemy engine options for the shared session database.
+
+    Server databases get liveness checks and recycling so long-lived workers
+    don't hand out connections the server has already closed. SQLite needs
+    neither.
+    """
+    if not session_store_uri or session_store_uri.startswith("sqlite"):
+        return {}
+    return {"pool_pre_ping": True, "pool_recycle": SESSION_DB_POOL_RECYCLE_SECONDS}
+
 
 class SessionServiceFactory:
-    """Factory for creating session services based on configuration."""
+    """Factory for creating session services based on configuration.
+
+    Session services are shared per process and backend: sessions are already
+    namespaced by ``app_name`` (the agent name), so sibling agents in a tree can
+    use one service instead of each opening its own database engine.
+    """
+
+    _services: Dict[Tuple[bool, Optional[str]], Union["DatabaseSessionService", "InMemorySessionService"]] = {}
+    # Sub-agents may be constructed concurrently (see core.tools)
+    _lock = threading.Lock()
     
-    @staticmethod
-    def create_session_service(agent_name: str) -> Tuple[Union[DatabaseSessionService, InMemorySessionService], bool]:
-        """Create session service based on configuration.
+    @classmethod
+    def create_session_service(cls, agent_name: str) -> Tuple[Union["DatabaseSessionService", "InMemorySessionService"], bool]:
+        """Create (or reuse) the session service based on configuration.
         
         Args:
             agent_name: Name of the agent
@@ -21,21 +49,30 @@ class SessionServiceFactory:
         Returns:
             Tuple of (session_service, use_database_sessions)
         """
-        logger.info(f"Setting up session service for agent: {agent_name}")
+        logger.info("Setting up session service for agent: %s", agent_name)
         
         # Check if AGENT_SESSION_STORE_URI is defined
         session_store_uri = os.getenv('AGENT_SESSION_STORE_URI')
+        use_database_sessions = os.getenv('AGENT_SHORT_TERM_MEMORY') == 'Database'
+        key = (use_database_sessions, session_store_uri if use_database_sessions else None)
         
-        if os.getenv('AGENT_SHORT_TERM_MEMORY') == 'Database':
-            # Use DatabaseSessionService for persistent storage
-            logger.info(f"Using DatabaseSessionService...")
-            session_service = DatabaseSessionService(session_store_uri)
-            use_database_sessions = True
-        else:
-            # Use InMemorySessionService for temporary storage
-            logger.info("Using InMemorySessionService (no AGENT_SHORT_TERM_MEMORY=Database)")
-            session_service = InMemorySessionService()
-            use_database_sessions = False
+        with cls._lock:
+            session_service = cls._services.get(key)
+            if session_service is None:
+                if use_database_sessions:
+                    # Use DatabaseSessionService for persistent storage. Imported
+                    # here so in-memory deployments never load SQLAlchemy
+                    from google.adk.sessions import DatabaseSessionService
+
+                    logger.info("Using DatabaseSessionService...")
+                    session_service = DatabaseSessionService(session_store_uri, **_engine_kwargs(session_store_uri))
+                else:
+                    # Use InMemorySessionService for temporary storage
+                    from google.adk.sessions import InMemorySessionService
+
+                    logger.info("Using InMemorySessionService (no AGENT_SHORT_TERM_MEMORY=Database)")
+                    session_service = InMemorySessionService()
+                cls._services[key] = session_service
             
-        logger.info(f"Session service for agent: {agent_name} created")
+        logger.info("Session service for agent: %s ready", agent_name)
         return session_service, use_database_sessions
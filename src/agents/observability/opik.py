@@ -42,9 +42,9 @@ class OpikObserver(BaseObserver):
                 project_name= opik_settings.OPIK_PROJECT_NAME
             )
 
-            logger.info(f"Opik tracing initialized for agent: {self.agent_config.agent_name}")
+            logger.info("Opik tracing initialized for agent: %s", self.agent_config.agent_name)
         except Exception as e:
-            logger.error(f"Failed to initialize Opik tracing: {e}")
+            logger.error("Failed to initialize Opik tracing: %s", e)
             self.tracer = None
     
     def before_agent_callback(self, *args, **kwargs) -> None:
@@ -55,7 +55,7 @@ class OpikObserver(BaseObserver):
         try:
             self.tracer.before_agent_callback(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in before_agent_callback: {e}")
+            logger.error("Error in before_agent_callback: %s", e)
     
     def after_agent_callback(self, *args, **kwargs) -> None:
         """After agent callback."""
@@ -65,7 +65,7 @@ class OpikObserver(BaseObserver):
         try:
             self.tracer.after_agent_callback(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in after_agent_callback: {e}")
+            logger.error("Error in after_agent_callback: %s", e)
 
     def before_model_callback(self, *args, **kwargs) -> None:
         """Before model callback."""
@@ -75,7 +75,7 @@ class OpikObserver(BaseObserver):
         try:
             self.tracer.before_model_callback(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in before_model_callback: {e}")
+            logger.error("Error in before_model_callback: %s", e)
     
     def after_model_callback(self, *args, **kwargs) -> None:
         """After model callback."""
@@ -89,7 +89,7 @@ class OpikObserver(BaseObserver):
                 usage_metadata = kwargs['llm_response'].usage_metadata
                 
                 if usage_metadata:
-                    logger.info(f"Found usage_metadata object: {usage_metadata}")
+                    logger.info("Found usage_metadata object: %s", usage_metadata)
                     
                     # Create the 'usage' dictionary from the metadata object's attributes.
                     # Use the original Google field names that Opik expects for Google Gemini
@@ -102,12 +102,12 @@ class OpikObserver(BaseObserver):
                     # Add this correctly formatted dictionary to kwargs.
                     # Opik will now find and use it successfully.
                     kwargs['usage'] = usage_dict
-                    logger.info(f"Successfully injected 'usage' dictionary into kwargs: {kwargs['usage']}")
+                    logger.info("Successfully injected 'usage' dictionary into kwargs: %s", kwargs['usage'])
 
             self.tracer.after_model_callback(*args, **kwargs)
             
         except Exception as e:
-            logger.error(f"Error in after_model_callback: {e}", exc_info=True)
+            logger.error("Error in after_model_callback: %s", e, exc_info=True)
 
 
     def before_tool_callback(self, *args, **kwargs) -> None:
@@ -118,7 +118,7 @@ class OpikObserver(BaseObserver):
         try:
             self.tracer.before_tool_callback(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in before_tool_callback: {e}")
+            logger.error("Error in before_tool_callback: %s", e)
     
     def after_tool_callback(self, *args, **kwargs) -> None:
         """After tool callback."""
@@ -128,5 +128,5 @@ class OpikObserver(BaseObserver):
         try:
             self.tracer.after_tool_callback(*args, **kwargs)
         except Exception as e:
-            logger.error(f"Error in after_tool_callback: {e}")
+            logger.error("Error in after_tool_callback: %s", e)
         
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Core AgentRegistry class for managing AI agents."""
 
 import logging
+import threading
 from typing import Dict, Type, Optional, List, Any
 from src.agents.all_agents.base_agent import BaseAgent
 from src.agents.configs.agent_config import AgentConfig
@@ -24,6 +25,9 @@ class AgentRegistry:
         self._agents: Dict[str, Type[BaseAgent]] = {}
         self._agent_configs: Dict[str, AgentConfig] = {}
         self._agent_instances: Dict[str, BaseAgent] = {}
+        # Per-agent locks so concurrent first calls (e.g. startup prewarm racing
+        # early requests) build each singleton once without serializing agents
+        self._instance_locks: Dict[str, threading.Lock] = {}
         logger.info("Agent registry initialized")
     
     def register_agent(self, name: str, agent_class: Type[BaseAgent], config: Optional[AgentConfig] = None) -> None:
@@ -42,7 +46,7 @@ class AgentRegistry:
         if config:
             self._agent_configs[name] = config
         
-        logger.info(f"Registered agent '{name}' with class {agent_class.__name__}")
+        logger.info("Registered agent '%s' with class %s", name, agent_class.__name__)
     
     def get_agent_class(self, name: str) -> Type[BaseAgent]:
         """
@@ -80,43 +84,48 @@ class AgentRegistry:
         
         # Return existing instance if it exists
         if cache_key in self._agent_instances:
-            logger.debug(f"Returning existing agent instance for '{name}'")
+            logger.debug("Returning existing agent instance for '%s'", name)
             return self._agent_instances[cache_key]
         
-        # Get agent class
-        agent_class = self.get_agent_class(name)
-        
-        # Use provided config or cached config (only for first creation)
-        agent_config = config or self._agent_configs.get(name)
-        
-        # Create instance (only once)
-        try:
-            if agent_config:
-                # Try to create with config first
-                instance = agent_class(agent_config)
-            else:
-                # Try to create with default constructor
-                instance = agent_class()
-        except (TypeError, ValueError) as e:
-            # If the agent doesn't accept config parameter, try without it
-            error_msg = str(e)
-            if ("takes 1 positional argument but 2 were given" in error_msg or 
-                "takes 0 positional arguments but 1 was given" in error_msg or
-                "unexpected keyword argument" in error_msg.lower()):
-                logger.info(f"Agent {agent_class.__name__} doesn't accept config parameter, creating without it. Error: {error_msg}")
-                try:
+        with self._instance_locks.setdefault(cache_key, threading.Lock()):
+            # Another thread may have created it while we waited for the lock
+            if cache_key in self._agent_instances:
+                return self._agent_instances[cache_key]
+            
+            # Get agent class
+            agent_class = self.get_agent_class(name)
+            
+            # Use provided config or cached config (only for first creation)
+            agent_config = config or self._agent_configs.get(name)
+            
+            # Create instance (only once)
+            try:
+                if agent_config:
+                    # Try to create with config first
+                    instance = agent_class(agent_config)
+                else:
+                    # Try to create with default constructor
                     instance = agent_class()
-                except Exception as e2:
-                    logger.error(f"Failed to create {agent_class.__name__} even without config: {e2}")
+            except (TypeError, ValueError) as e:
+                # If the agent doesn't accept config parameter, try without it
+                error_msg = str(e)
+                if ("takes 1 positional argument but 2 were given" in error_msg or 
+                    "takes 0 positional arguments but 1 was given" in error_msg or
+                    "unexpected keyword argument" in error_msg.lower()):
+                    logger.info("Agent %s doesn't accept config parameter, creating without it. Error: %s", agent_class.__name__, error_msg)
+                    try:
+                        instance = agent_class()
+                    except Exception as e2:
+                        logger.error("Failed to create %s even without config: %s", agent_class.__name__, e2)
+                        raise
+                else:
+                    logger.error("Unexpected error creating %s: %s", agent_class.__name__, e)
                     raise
-            else:
-                logger.error(f"Unexpected error creating {agent_class.__name__}: {e}")
-                raise
-        
-        # Cache the instance (singleton)
-        self._agent_instances[cache_key] = instance
+            
+            # Cache the instance (singleton)
+            self._agent_instances[cache_key] = instance
         
-        logger.info(f"Created singleton agent instance for '{name}'")
+        logger.info("Created singleton agent instance for '%s'", name)
         return instance
     
     def list_agents(self) -> List[str]:
@@ -185,9 +194,9 @@ class AgentRegistry:
         """
         if name in self._agent_instances:
             del self._agent_instances[name]
-            logger.info(f"Cleared agent instance for '{name}'")
+            logger.info("Cleared agent instance for '%s'", name)
         else:
-            logger.warning(f"Agent instance '{name}' not found in cache")
+            logger.warning("Agent instance '%s' not found in cache", name)
     
     def __str__(self) -> str:
         """String representation of the registry."""
@@ -5,7 +5,7 @@ import importlib
 import logging
 from typing import Optional, List, Union
 from src.agents.all_agents.base_agent import BaseAgent
-from src.agents.configs.agent_config import AgentConfig
+from src.agents.core.config import load_agent_config
 
 logger = logging.getLogger(__name__)
 
@@ -33,10 +33,10 @@ class AgentDiscovery:
             agents_dirs = agents_dir
         
         for agents_dir in agents_dirs:
-            logger.info(f"Discovering agents in {agents_dir}")
+            logger.info("Discovering agents in %s", agents_dir)
             
             if not os.path.exists(agents_dir):
-                logger.warning(f"Agents directory {agents_dir} does not exist, skipping")
+                logger.warning("Agents directory %s does not exist, skipping", agents_dir)
                 continue
             
             # Walk through the agents directory
@@ -81,15 +81,17 @@ class AgentDiscovery:
                     config = None
                     if config_path:
                         try:
-                            config = AgentConfig.from_yaml(config_path)
+                            # Goes through the shared config cache, so the agent's
+                            # own construction later reuses this parse
+                            config = load_agent_config(config_path=config_path)
                         except Exception as e:
-                            logger.warning(f"Could not load config from {config_path}: {e}")
+                            logger.warning("Could not load config from %s: %s", config_path, e)
                     
                     self.registry.register_agent(agent_name, attr, config)
-                    logger.info(f"Auto-registered agent '{agent_name}' from {file_path}")
+                    logger.info("Auto-registered agent '%s' from %s", agent_name, file_path)
         
         except Exception as e:
-            logger.warning(f"Could not process file {file_path}: {e}")
+            logger.warning("Could not process file %s: %s", file_path, e)
     
     def _generate_agent_name(self, class_name: str) -> str:
         """
@@ -3,11 +3,11 @@
 import json
 import logging
 import opik
+import orjson
 from typing import Dict, Any
 from src.agents.tools.base_tool import BaseTool
 from src.agents.utils.azure_utils import AzureUtils
 from src.agents.utils.pdf_utils import PdfUtils
-from google.adk.tools import FunctionTool
 
 logger = logging.getLogger(__name__)
 
@@ -38,19 +38,18 @@ class AzureArtifactTool(BaseTool):
             if not input or input.strip() == "":
                 return json.dumps({"error": "No input provided. Please provide blob_path in format: container/blob_name"})
             
-            # Parse the input
-            try:
-                params = json.loads(input) if isinstance(input, str) else input
-            except json.JSONDecodeError:
-                # If input is not JSON, treat it as a direct blob path
-                blob_path = input.strip()
-            else:
+            # Parse the input; anything that isn't a JSON object is a direct blob path
+            input = input.strip()
+            if input.startswith("{"):
+                params = orjson.loads(input)
                 blob_path = params.get("blob_path") or params.get("input", "")
+            else:
+                blob_path = input
             
             if not blob_path:
                 return json.dumps({"error": "blob_path is required. Format: container/blob_name"})
             
-            logger.info(f"Reading Azure artifact: {blob_path}")
+            logger.info("Reading Azure artifact: %s", blob_path)
             print(f"📄 AZURE ARTIFACT TOOL: Reading PDF from {blob_path}")
             
             # Parse blob path (container/blob_name)
@@ -65,7 +64,7 @@ class AzureArtifactTool(BaseTool):
             return json.dumps(result)
                 
         except Exception as e:
-            logger.error(f"Error in Azure artifact tool: {e}")
+            logger.error("Error in Azure artifact tool: %s", e)
             return json.dumps({"error": str(e)})
     
     def _read_pdf_with_processing(self, container_name: str, blob_name: str) -> Dict[str, Any]:
@@ -88,9 +87,3 @@ class AzureArtifactTool(BaseTool):
             "blob_size": blob_result["size"],
             "status": "success"
         }
-    
-    @opik.track(name="azure_artifact_tool_to_function_tool", tags=["azure_artifact_tool"])
-    def to_function_tool(self) -> FunctionTool:
-        """Convert this tool to a Google ADK FunctionTool."""
-        # Use the base class implementation which properly handles function metadata
-        return super().to_function_tool()
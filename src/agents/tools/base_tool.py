@@ -1,5 +1,6 @@
 """Base class for all tools."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from functools import wraps
 from typing import Callable
@@ -32,13 +33,15 @@ class BaseTool(ABC):
         
         This is a default implementation that can be overridden by subclasses.
         Uses functools.wraps to properly preserve function metadata.
+        The wrapper is async and runs the (blocking) ``run`` in a worker
+        thread, so a slow tool call doesn't stall the event loop.
         """
         from google.adk.tools import FunctionTool
         
         @wraps(self.run)
-        def tool_function(input: str) -> str:
+        async def tool_function(input: str) -> str:
             """Tool function wrapper."""
-            return self.run(input)
+            return await asyncio.to_thread(self.run, input)
         
         # Set the name and description on the wrapper function
         tool_function.__name__ = self.tool_name
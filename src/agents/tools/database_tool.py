@@ -4,9 +4,8 @@ import json
 import logging
 from typing import Dict, Any, List, Optional
 import opik
+import orjson
 from src.agents.tools.base_tool import BaseTool
-from google.adk.tools import FunctionTool
-from google.adk.models.lite_llm import LiteLlm
 
 logger = logging.getLogger(__name__)
 
@@ -49,10 +48,10 @@ class DatabaseInfoTool(BaseTool):
         """
         try:
             # Parse the input
-            params = json.loads(input) if isinstance(input, str) else input
+            params = orjson.loads(input) if isinstance(input, str) else input
             operation = params.get("operation", "list_tables")
             
-            logger.info(f"Executing database operation: {operation}")
+            logger.info("Executing database operation: %s", operation)
             print(f"🔧 DATABASE TOOL: Executing operation: {operation}")
             
             if operation == "list_tables":
@@ -85,10 +84,9 @@ class DatabaseInfoTool(BaseTool):
                 })
                 
         except Exception as e:
-            logger.error(f"Error in database tool: {e}")
+            logger.error("Error in database tool: %s", e)
             return json.dumps({"error": str(e)})
     
-    @opik.track(name="database_tool_list_tables", tags=["database_tool"])
     def _list_tables(self) -> str:
         """List all available tables."""
         tables = list(self.sample_data.keys())
@@ -97,7 +95,6 @@ class DatabaseInfoTool(BaseTool):
             "count": len(tables)
         })
     
-    @opik.track(name="database_tool_get_table_schema", tags=["database_tool"])
     def _get_table_schema(self, table_name: str) -> str:
         """Get the schema of a specific table."""
         if not table_name:
@@ -117,7 +114,6 @@ class DatabaseInfoTool(BaseTool):
         
         return json.dumps(schema)
     
-    @opik.track(name="database_tool_query_table", tags=["database_tool"])
     def _query_table(self, table_name: str, limit: int = 10) -> str:
         """Query a table with a limit."""
         if not table_name:
@@ -134,7 +130,6 @@ class DatabaseInfoTool(BaseTool):
             "total_available": len(self.sample_data[table_name])
         })
     
-    @opik.track(name="database_tool_search_records", tags=["database_tool"])
     def _search_records(self, table_name: str, search_field: str, search_value: str) -> str:
         """Search for records in a table."""
         if not all([table_name, search_field, search_value]):
@@ -157,7 +152,6 @@ class DatabaseInfoTool(BaseTool):
             "count": len(matching_records)
         })
     
-    @opik.track(name="database_tool_get_table_stats", tags=["database_tool"])
     def _get_table_stats(self, table_name: str) -> str:
         """Get statistics for a table."""
         if not table_name:
@@ -201,9 +195,3 @@ class DatabaseInfoTool(BaseTool):
                     }
         
         return json.dumps(stats)
-    
-    @opik.track(name="database_tool_to_function_tool", tags=["database_tool"])
-    def to_function_tool(self) -> FunctionTool:
-        """Convert this tool to a Google ADK FunctionTool."""
-        # Use the base class implementation which properly handles function metadata
-        return super().to_function_tool()
@@ -44,7 +44,7 @@ class AzureUtils:
             logger.warning("Azure libraries not installed. AzureUtils will not function.")
             self._blob_service_client = None
         except Exception as e:
-            logger.error(f"Failed to setup Azure client: {e}")
+            logger.error("Failed to setup Azure client: %s", e)
             self._blob_service_client = None
         finally:
             self._client_initialized = True
@@ -86,12 +86,12 @@ class AzureUtils:
             # Check if it's an Azure error
             error_type = type(e).__name__
             if "Azure" in error_type or "azure" in str(type(e)):
-                logger.error(f"Azure error downloading blob: {e}")
+                logger.error("Azure error downloading blob: %s", e)
                 return {"error": f"Azure error: {str(e)}"}
-            logger.error(f"Error downloading blob: {e}")
+            logger.error("Error downloading blob: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Error downloading blob: {e}")
+            logger.error("Error downloading blob: %s", e)
             return {"error": str(e)}
     
     def list_blobs(self, container_name: str, file_extension: Optional[str] = None) -> Dict[str, Any]:
@@ -129,9 +129,9 @@ class AzureUtils:
         except Exception as e:
             error_type = type(e).__name__
             if "Azure" in error_type or "azure" in str(type(e)):
-                logger.error(f"Azure error listing blobs: {e}")
+                logger.error("Azure error listing blobs: %s", e)
                 return {"error": f"Azure error: {str(e)}"}
-            logger.error(f"Error listing blobs: {e}")
+            logger.error("Error listing blobs: %s", e)
             return {"error": str(e)}
     
     def get_blob_metadata(self, container_name: str, blob_name: str) -> Dict[str, Any]:
@@ -164,9 +164,9 @@ class AzureUtils:
         except Exception as e:
             error_type = type(e).__name__
             if "Azure" in error_type or "azure" in str(type(e)):
-                logger.error(f"Azure error getting blob metadata: {e}")
+                logger.error("Azure error getting blob metadata: %s", e)
                 return {"error": f"Azure error: {str(e)}"}
-            logger.error(f"Error getting blob metadata: {e}")
+            logger.error("Error getting blob metadata: %s", e)
             return {"error": str(e)}
     
     def blob_exists(self, container_name: str, blob_name: str) -> Dict[str, Any]:
@@ -195,9 +195,9 @@ class AzureUtils:
         except Exception as e:
             error_type = type(e).__name__
             if "Azure" in error_type or "azure" in str(type(e)):
-                logger.error(f"Azure error checking blob existence: {e}")
+                logger.error("Azure error checking blob existence: %s", e)
                 return {"error": f"Azure error: {str(e)}"}
-            logger.error(f"Error checking blob existence: {e}")
+            logger.error("Error checking blob existence: %s", e)
             return {"error": str(e)}
     
     def search_blobs_by_name(self, container_name: str, search_pattern: str) -> Dict[str, Any]:
@@ -231,9 +231,9 @@ class AzureUtils:
         except Exception as e:
             error_type = type(e).__name__
             if "Azure" in error_type or "azure" in str(type(e)):
-                logger.error(f"Azure error searching blobs: {e}")
+                logger.error("Azure error searching blobs: %s", e)
                 return {"error": f"Azure error: {str(e)}"}
-            logger.error(f"Error searching blobs: {e}")
+            logger.error("Error searching blobs: %s", e)
             return {"error": str(e)}
     
     # Mock data methods for testing when Azure credentials are not available
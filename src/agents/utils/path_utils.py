@@ -1,9 +1,12 @@
 """Utility functions for path resolution in agents."""
 
+import functools
 import os
 from typing import Optional
 
 
+# Memoized: agents resolve the same small set of `__file__` paths on every instantiation
+@functools.lru_cache(maxsize=256)
 def resolve_config_path(config_filename: Optional[str] = None, relative_to: Optional[str] = None) -> str:
     """
     Resolve a configuration file path relative to the calling agent file.
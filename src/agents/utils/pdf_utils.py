@@ -31,7 +31,7 @@ class PdfUtils:
             }
             
         except Exception as e:
-            logger.error(f"Error extracting PDF text: {e}")
+            logger.error("Error extracting PDF text: %s", e)
             return {"error": str(e)}
     
     def get_pdf_info(self, pdf_bytes: bytes) -> Dict[str, Any]:
@@ -53,7 +53,7 @@ class PdfUtils:
             return info
             
         except Exception as e:
-            logger.warning(f"PyMuPDF failed, trying PyPDF2: {e}")
+            logger.warning("PyMuPDF failed, trying PyPDF2: %s", e)
             try:
                 # Fallback to PyPDF2
                 pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
@@ -65,7 +65,7 @@ class PdfUtils:
                 }
                 
             except Exception as e2:
-                logger.error(f"Both PDF libraries failed: {e2}")
+                logger.error("Both PDF libraries failed: %s", e2)
                 return {"error": f"Error getting PDF info: {str(e2)}"}
     
     def search_text_in_pdf(self, pdf_bytes: bytes, search_text: str) -> Dict[str, Any]:
@@ -97,7 +97,7 @@ class PdfUtils:
             return result
             
         except Exception as e:
-            logger.error(f"Error searching PDF text: {e}")
+            logger.error("Error searching PDF text: %s", e)
             return {"error": str(e)}
     
     def extract_pages(self, pdf_bytes: bytes, page_numbers: List[int] = None) -> Dict[str, Any]:
@@ -133,7 +133,7 @@ class PdfUtils:
             }
             
         except Exception as e:
-            logger.warning(f"PyMuPDF failed, trying PyPDF2: {e}")
+            logger.warning("PyMuPDF failed, trying PyPDF2: %s", e)
             try:
                 # Fallback to PyPDF2
                 pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
@@ -159,7 +159,7 @@ class PdfUtils:
                 }
                 
             except Exception as e2:
-                logger.error(f"Both PDF libraries failed: {e2}")
+                logger.error("Both PDF libraries failed: %s", e2)
                 return {"error": f"Error extracting pages: {str(e2)}"}
     
     def get_page_count(self, pdf_bytes: bytes) -> Dict[str, Any]:
@@ -179,7 +179,7 @@ class PdfUtils:
             }
             
         except Exception as e:
-            logger.warning(f"PyMuPDF failed, trying PyPDF2: {e}")
+            logger.warning("PyMuPDF failed, trying PyPDF2: %s", e)
             try:
                 # Fallback to PyPDF2
                 pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
@@ -191,7 +191,7 @@ class PdfUtils:
                 }
                 
             except Exception as e2:
-                logger.error(f"Both PDF libraries failed: {e2}")
+                logger.error("Both PDF libraries failed: %s", e2)
                 return {"error": f"Error getting page count: {str(e2)}"}
     
     def _extract_text_from_pdf_bytes(self, pdf_bytes: bytes) -> str:
@@ -209,7 +209,7 @@ class PdfUtils:
             return text_content.strip()
             
         except Exception as e:
-            logger.warning(f"PyMuPDF failed, trying PyPDF2: {e}")
+            logger.warning("PyMuPDF failed, trying PyPDF2: %s", e)
             try:
                 # Fallback to PyPDF2
                 pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
@@ -221,7 +221,7 @@ class PdfUtils:
                 return text_content.strip()
                 
             except Exception as e2:
-                logger.error(f"Both PDF libraries failed: {e2}")
+                logger.error("Both PDF libraries failed: %s", e2)
                 return f"Error extracting text from PDF: {str(e2)}"
     
     def _get_text_preview(self, text: str, search_text: str, context_length: int = 100) -> str:
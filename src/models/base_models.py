@@ -1,36 +1,48 @@
 """Models for the agents."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Any
 
 # Base input/output models
 class TextInput(BaseModel):
     """Simple text input."""
+    model_config = ConfigDict(frozen=True)
+
     text: str
 
 class TextOutput(BaseModel):
     """Simple text output."""
+    model_config = ConfigDict(frozen=True)
+
     response: str
 
 class FeatureMap(BaseModel):
     """Feature map for the agent."""
+    model_config = ConfigDict(frozen=True)
+
     feature_name: str = Field(description="Feature name")
     feature_value: Any = Field(description="Feature value")
 
 class Artifact(BaseModel):
     """Artifact for the agent."""
+    model_config = ConfigDict(frozen=True)
+
     artifact_name: str = Field(description="Artifact name")
     artifact_path: str = Field(description="Artifact path")
 
 class AgentChatRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     agent_name: str
     user_id: str = None
     session_id: str = None
     sender: str = Field(description="Sender", default="USER")
     query: Any = Field(description="Query")
-    features: Optional[List[FeatureMap]] = Field(description="List of features", default=[])
-    artifacts: Optional[List[Artifact]] = Field(description="List of artifacts", default=[])
+    features: Optional[List[FeatureMap]] = Field(description="List of features", default_factory=list)
+    artifacts: Optional[List[Artifact]] = Field(description="List of artifacts", default_factory=list)
 
 class AgentChatResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     agent_name: str
     user_id: str
     session_id: str
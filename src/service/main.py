@@ -1,6 +1,8 @@
 '''
 This is the main file for the backend.
 '''
+import asyncio
+import contextlib
 import logging
 import os
 import uvicorn
@@ -8,7 +10,7 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
 from dotenv import load_dotenv
-from src.agents.registry import discover_agents
+from src.agents.registry import discover_agents, get_agent_instance, list_agents
 from src.service.routers.rest_router import router as rest_router
 from debug_ui.router import router as debug_router
 load_dotenv()
@@ -23,6 +25,27 @@ project_root = os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(_
 # Mount branding assets EARLY (before FastAPI app creation to ensure images are available)
 branding_path = os.path.abspath(os.path.join(project_root, "branding"))
 
+async def _prewarm_agents() -> None:
+    """Build every registered agent in a worker thread so first requests skip cold start."""
+    for name in list_agents():
+        try:
+            await asyncio.to_thread(get_agent_instance, name)
+        except Exception as e:
+            logger.warning("Could not prewarm agent '%s': %s", name, e)
+    logger.info("Prewarmed agents")
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Off by default: holding every agent in memory up front matters on small dynos
+    prewarm_task = None
+    if os.environ.get("PREWARM_AGENTS", "false").lower() == "true":
+        prewarm_task = asyncio.create_task(_prewarm_agents())
+    yield
+    if prewarm_task is not None:
+        prewarm_task.cancel()
+
+
 app = FastAPI(
     title="AgentShip API",
     description="AgentShip - An Agent Shipping Kit. Production-ready AI Agent framework with multiple agent patterns and observability.",
@@ -38,6 +61,7 @@ app = FastAPI(
     docs_url="/swagger",  # Swagger UI at /swagger (keep for direct access)
     redoc_url=None,  # Disable default /redoc (redirect to /docs)
     openapi_url="/openapi.json",  # OpenAPI JSON at /openapi.json
+    lifespan=lifespan,
     swagger_ui_parameters={
         "faviconUrl": "/branding/favicons/favicon-32.png",
     },
@@ -156,17 +180,17 @@ async def redoc_redirect():
 if os.path.exists(branding_path):
     try:
         app.mount("/branding", StaticFiles(directory=branding_path), name="branding")
-        logger.info(f"🎨 Branding assets mounted at /branding from {branding_path}")
+        logger.info("🎨 Branding assets mounted at /branding from %s", branding_path)
         # Test that a file exists
         test_file = os.path.join(branding_path, "icons", "icon-light-2048.png")
         if os.path.exists(test_file):
-            logger.info(f"✅ Test file exists: {test_file}")
+            logger.info("✅ Test file exists: %s", test_file)
         else:
-            logger.warning(f"⚠️  Test file not found: {test_file}")
+            logger.warning("⚠️  Test file not found: %s", test_file)
     except Exception as e:
-        logger.error(f"❌ Failed to mount branding assets: {e}")
+        logger.error("❌ Failed to mount branding assets: %s", e)
 else:
-    logger.warning(f"⚠️  Branding assets not found at {branding_path}")
+    logger.warning("⚠️  Branding assets not found at %s", branding_path)
 
 # Ensure agents are discovered (idempotent)
 # Uses AGENT_DIRECTORIES env var or defaults to framework agents only
@@ -198,7 +222,7 @@ if debug_ui_enabled:
         
         logger.info("🔧 Debug UI mounted at /debug-ui")
     else:
-        logger.warning(f"Debug UI static files not found at {static_path}")
+        logger.warning("Debug UI static files not found at %s", static_path)
 
 # Prometheus metrics (optional - install prometheus-fastapi-instrumentator)
 # Uncomment to enable standard Prometheus metrics including memory/CPU
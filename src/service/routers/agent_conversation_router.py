@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.encoders import jsonable_encoder
 from src.agents.registry import get_agent_instance
 import logging
@@ -8,25 +8,27 @@ from src.models.base_models import FeatureMap, AgentChatRequest, AgentChatRespon
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-@router.post("/chat")
-async def chat(request: AgentChatRequest) -> AgentChatResponse:
+@router.post("/chat", response_model=None, responses={200: {"model": AgentChatResponse}})
+async def chat(request: AgentChatRequest) -> Response:
     """
     Generic chat endpoint that routes to the requested agent using the registry.
     """
     try:
-        logger.info(f"Chatting with agent: {request.agent_name}")
+        logger.debug("Chatting with agent: %s", request.agent_name)
 
         # Get agent instance from registry (singleton)
         agent = get_agent_instance(request.agent_name)
 
         # Delegate chat to the agent implementation
         result = await agent.chat(request)
-        logger.info(f"Result from agent chat: {result}")
+        logger.debug("Result from agent chat: %s", result)
 
-        return result
+        # Serialize the agent's response directly; a response_model would dump it
+        # to a dict and validate a fresh copy before encoding
+        return Response(content=result.model_dump_json(), media_type="application/json")
             
     except KeyError as e:
-        logger.error(f"Agent not found: {e}")
+        logger.error("Agent not found: %s", e)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.exception("Agent chat failed")
@@ -54,3 +54,17 @@ def mock_runner(mock_runner_response):
         return mock_run
     
     return create_mock_run
+
+
+@pytest.fixture
+def mock_async_runner(mock_runner_response):
+    """Create a mock Google ADK Runner.run_async() that yields a fake response."""
+    
+    def create_mock_run_async(output_data: dict):
+        """Create a mock run_async() method that yields a response with the given output."""
+        async def mock_run_async(user_id: str, session_id: str, new_message):
+            """Mock runner.run_async() that yields a fake response."""
+            yield mock_runner_response(output_data)
+        return mock_run_async
+    
+    return create_mock_run_async
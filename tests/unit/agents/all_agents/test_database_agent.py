@@ -42,12 +42,12 @@ def test_database_agent_input_schema(agent):
 
 
 @pytest.mark.asyncio
-async def test_database_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_database_agent_chat(mock_async_runner, mock_session_manager, agent):
     """Test that DatabaseAgent chat() works with mocked LLM."""
     # Mock the runner to return a database response
-    mock_run = mock_runner({"response": "Tables: users, products, orders"})
+    mock_run = mock_async_runner({"response": "Tables: users, products, orders"})
     agent.runner = Mock()
-    agent.runner.run = mock_run
+    agent.runner.run_async = mock_run
     agent.session_manager = mock_session_manager
     
     request = AgentChatRequest(
@@ -50,16 +50,35 @@ def test_file_analysis_agent_chat_without_artifacts(agent):
 
 
 @pytest.mark.asyncio
-async def test_file_analysis_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_file_analysis_agent_chat_stream_without_artifacts(agent):
+    """Test that FileAnalysisAgent streams an error event when no artifacts provided."""
+    request = AgentChatRequest(
+        agent_name="file_analysis_agent",
+        user_id="test_user",
+        session_id="test_session",
+        query="",
+        features=[],
+        artifacts=[]  # No artifacts
+    )
+
+    events = [event async for event in agent.chat_stream(request)]
+
+    assert len(events) == 1
+    assert events[0]["type"] == "error"
+    assert "No artifacts" in events[0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_file_analysis_agent_chat(mock_async_runner, mock_session_manager, agent):
     """Test that FileAnalysisAgent chat() works with mocked LLM."""
     # Mock the runner to return medical report analysis
-    mock_run = mock_runner({
+    mock_run = mock_async_runner({
         "summary": "Patient shows signs of improvement",
         "key_findings": ["Blood pressure normalized", "Cholesterol levels improved"],
         "recommendations": ["Continue current medication", "Follow up in 3 months"]
     })
     agent.runner = Mock()
-    agent.runner.run = mock_run
+    agent.runner.run_async = mock_run
     agent.session_manager = mock_session_manager
     
     request = AgentChatRequest(
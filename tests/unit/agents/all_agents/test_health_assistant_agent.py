@@ -44,16 +44,16 @@ def test_health_assistant_agent_input_schema(agent):
 
 
 @pytest.mark.asyncio
-async def test_health_assistant_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_health_assistant_agent_chat(mock_async_runner, mock_session_manager, agent):
     """Test that HealthAssistantAgent chat() works with mocked LLM."""
     # Mock the runner to return a health assistant response
-    mock_run = mock_runner({
+    mock_run = mock_async_runner({
         "answer": "Based on your last visit, the key findings were...",
         "session_id": "test_session",
         "user_id": "test_user"
     })
     agent.runner = Mock()
-    agent.runner.run = mock_run
+    agent.runner.run_async = mock_run
     agent.session_manager = mock_session_manager
     
     request = AgentChatRequest(
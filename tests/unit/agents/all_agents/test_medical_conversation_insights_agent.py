@@ -50,16 +50,16 @@ def test_medical_conversation_insights_agent_input_schema(agent):
 
 
 @pytest.mark.asyncio
-async def test_medical_conversation_insights_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_medical_conversation_insights_agent_chat(mock_async_runner, mock_session_manager, agent):
     """Test that MedicalConversationInsightsAgent chat() works with mocked LLM."""
     # Mock the runner to return conversation insights
-    mock_run = mock_runner({
+    mock_run = mock_async_runner({
         "summary": "Patient reported chest pain, doctor asked for description",
         "key_findings": ["Chest pain reported", "Needs further evaluation", "Patient is concerned"],
         "action_items": ["Schedule follow-up", "Order tests", "Monitor symptoms"]
     })
     agent.runner = Mock()
-    agent.runner.run = mock_run
+    agent.runner.run_async = mock_run
     agent.session_manager = mock_session_manager
     
     request = AgentChatRequest(
@@ -46,10 +46,10 @@ def test_medical_followup_agent_input_schema(agent):
 
 
 @pytest.mark.asyncio
-async def test_medical_followup_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_medical_followup_agent_chat(mock_async_runner, mock_session_manager, agent):
     """Test that MedicalFollowupAgent chat() works with mocked LLM."""
     # Mock the runner to return followup questions
-    mock_run = mock_runner({
+    mock_run = mock_async_runner({
         "followup_questions": [
             "What activities trigger the chest pain?",
             "Have you experienced similar pain before?",
@@ -58,7 +58,7 @@ async def test_medical_followup_agent_chat(mock_runner, mock_session_manager, ag
         "count": 3
     })
     agent.runner = Mock()
-    agent.runner.run = mock_run
+    agent.runner.run_async = mock_run
     agent.session_manager = mock_session_manager
     
     request = AgentChatRequest(
@@ -50,16 +50,16 @@ def test_medical_reports_analysis_agent_chat_without_artifacts(agent):
 
 
 @pytest.mark.asyncio
-async def test_medical_reports_analysis_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_medical_reports_analysis_agent_chat(mock_async_runner, mock_session_manager, agent):
     """Test that MedicalReportsAnalysisAgent chat() works with mocked LLM."""
     # Mock the runner to return medical report analysis
-    mock_run = mock_runner({
+    mock_run = mock_async_runner({
         "summary": "Patient shows signs of improvement",
         "key_findings": ["Blood pressure normalized", "Cholesterol levels improved"],
         "recommendations": ["Continue current medication", "Follow up in 3 months"]
     })
     agent.runner = Mock()
-    agent.runner.run = mock_run
+    agent.runner.run_async = mock_run
     agent.session_manager = mock_session_manager
     
     request = AgentChatRequest(
@@ -42,12 +42,12 @@ def test_translation_agent_input_schema(agent):
 
 
 @pytest.mark.asyncio
-async def test_translation_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_translation_agent_chat(mock_async_runner, mock_session_manager, agent):
     """Test that TranslationAgent chat() works with mocked LLM."""
     # Mock the runner to return a translation response
-    mock_run = mock_runner({"translated_text": "Hola, ¿cómo estás?"})
+    mock_run = mock_async_runner({"translated_text": "Hola, ¿cómo estás?"})
     agent.runner = Mock()
-    agent.runner.run = mock_run
+    agent.runner.run_async = mock_run
     agent.session_manager = mock_session_manager
     
     request = AgentChatRequest(
@@ -68,3 +68,171 @@ async def test_translation_agent_chat(mock_runner, mock_session_manager, agent):
     assert response.agent_name == "translation_agent"
     assert isinstance(response.agent_response, TranslationOutput)
     assert response.agent_response.translated_text == "Hola, ¿cómo estás?"
+
+
+@pytest.mark.asyncio
+async def test_translation_agent_chat_stream(mock_async_runner, mock_session_manager, agent):
+    """Test that TranslationAgent chat_stream() yields content from the async runner."""
+    agent.runner = Mock()
+    agent.runner.run_async = mock_async_runner({"translated_text": "Hola"})
+    agent.session_manager = mock_session_manager
+    
+    request = AgentChatRequest(
+        agent_name="translation_agent",
+        user_id="test_user",
+        session_id="test_session",
+        query={
+            "text": "Hello",
+            "from_language": "en",
+            "to_language": "es"
+        },
+        features=[]
+    )
+    
+    events = [event async for event in agent.chat_stream(request)]
+    
+    assert [event["type"] for event in events] == ["thinking", "content", "done"]
+    assert '"translated_text": "Hola"' in events[1]["text"]
+
+
+@pytest.mark.asyncio
+async def test_translation_agent_run_stops_at_final_response(mock_runner_response, mock_session_manager, agent):
+    """Test that run() returns the final response without draining later events."""
+    final_event = mock_runner_response({"translated_text": "Hola"})
+    final_event.author = agent.agent.name
+    final_event.is_final_response = lambda: True
+    consumed = []
+    
+    async def mock_run(user_id: str, session_id: str, new_message):
+        for event in (final_event, mock_runner_response({"translated_text": "Adiós"})):
+            consumed.append(event)
+            yield event
+    
+    agent.runner = Mock()
+    agent.runner.run_async = mock_run
+    agent.session_manager = mock_session_manager
+    
+    result = await agent.run("test_user", "test_session", TranslationInput(text="Hello", from_language="en", to_language="es"))
+    
+    assert result.translated_text == "Hola"
+    assert consumed == [final_event]
+
+
+@pytest.mark.asyncio
+async def test_translation_agent_run_waits_for_own_final_response(mock_runner_response, mock_session_manager, agent):
+    """Test that a sub-agent's final response does not end the run early."""
+    sub_agent_event = mock_runner_response({"translated_text": "Hola"})
+    sub_agent_event.author = "sub_agent"
+    sub_agent_event.is_final_response = lambda: True
+    root_event = mock_runner_response({"translated_text": "Hola, mundo"})
+    root_event.author = agent.agent.name
+    root_event.is_final_response = lambda: True
+    consumed = []
+    
+    async def mock_run(user_id: str, session_id: str, new_message):
+        for event in (sub_agent_event, root_event):
+            consumed.append(event)
+            yield event
+    
+    agent.runner = Mock()
+    agent.runner.run_async = mock_run
+    agent.session_manager = mock_session_manager
+    
+    result = await agent.run("test_user", "test_session", TranslationInput(text="Hello", from_language="en", to_language="es"))
+    
+    assert result.translated_text == "Hola, mundo"
+    assert consumed == [sub_agent_event, root_event]
+
+
+@pytest.mark.asyncio
+async def test_translation_agent_run_closes_runner_after_own_final_response(mock_runner_response, mock_session_manager, agent):
+    """Test that the runner is closed at the agent's final response, not at a sub-agent's."""
+    sub_agent_event = mock_runner_response({"translated_text": "Hola"})
+    sub_agent_event.author = "sub_agent"
+    sub_agent_event.is_final_response = lambda: True
+    root_event = mock_runner_response({"translated_text": "Hola, mundo"})
+    root_event.author = agent.agent.name
+    root_event.is_final_response = lambda: True
+    closed_after = []
+    
+    async def mock_run(user_id: str, session_id: str, new_message):
+        yielded = []
+        try:
+            for event in (sub_agent_event, root_event, mock_runner_response({"translated_text": "Adiós"})):
+                yielded.append(event)
+                yield event
+        finally:
+            closed_after.extend(yielded)
+    
+    agent.runner = Mock()
+    agent.runner.run_async = mock_run
+    agent.session_manager = mock_session_manager
+    
+    result = await agent.run("test_user", "test_session", TranslationInput(text="Hello", from_language="en", to_language="es"))
+    
+    assert result.translated_text == "Hola, mundo"
+    assert closed_after == [sub_agent_event, root_event]
+
+
+@pytest.mark.asyncio
+async def test_translation_agent_run_recreates_missing_session(mock_async_runner, mock_session_manager, agent):
+    """Test that run() recreates a session the session service no longer has."""
+    mock_run = mock_async_runner({"translated_text": "Hola"})
+    calls = []
+    
+    async def expired_then_ok(user_id: str, session_id: str, new_message):
+        calls.append(session_id)
+        if len(calls) == 1:
+            raise ValueError(f"Session not found: {session_id}")
+        async for event in mock_run(user_id, session_id, new_message):
+            yield event
+    
+    agent.runner = Mock()
+    agent.runner.run_async = expired_then_ok
+    agent.session_manager = mock_session_manager
+    
+    result = await agent.run("test_user", "test_session", TranslationInput(text="Hello", from_language="en", to_language="es"))
+    
+    assert result.translated_text == "Hola"
+    assert calls == ["test_session", "test_session"]
+    mock_session_manager.forget_session.assert_called_once_with("test_user", "test_session")
+    assert mock_session_manager.ensure_session_exists.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_translation_agent_chat_reuses_cached_response(mock_async_runner, mock_session_manager, agent):
+    """Test that repeating a translation request is served from the response cache."""
+    calls = []
+    mock_run = mock_async_runner({"translated_text": "Hola"})
+    
+    async def counting_run(user_id: str, session_id: str, new_message):
+        calls.append(new_message)
+        async for event in mock_run(user_id, session_id, new_message):
+            yield event
+    
+    agent.runner = Mock()
+    agent.runner.run_async = counting_run
+    agent.session_manager = mock_session_manager
+    
+    def make_request(text):
+        return AgentChatRequest(
+            agent_name="translation",
+            user_id="test_user",
+            session_id="test_session",
+            query={"text": text, "from_language": "en", "to_language": "es"},
+            features=[]
+        )
+    
+    first = await agent.chat(make_request("Hello"))
+    second = await agent.chat(make_request("Hello"))
+    await agent.chat(make_request("Goodbye"))
+    
+    assert first.agent_response.translated_text == "Hola"
+    assert second.agent_response == first.agent_response
+    assert len(calls) == 2
+    
+    # Each caller gets its own copy of the cached output
+    first.agent_response.translated_text = "changed"
+    third = await agent.chat(make_request("Hello"))
+    assert third.agent_response.translated_text == "Hola"
+    assert len(calls) == 2
@@ -46,16 +46,16 @@ def test_trip_planner_agent_input_schema(agent):
 
 
 @pytest.mark.asyncio
-async def test_trip_planner_agent_chat(mock_runner, mock_session_manager, agent):
+async def test_trip_planner_agent_chat(mock_async_runner, mock_session_manager, agent):
     """Test that TripPlannerAgent chat() works with mocked LLM."""
     # Mock the runner to return a trip plan response
-    mock_run = mock_runner({
+    mock_run = mock_async_runner({
         "flight_plan": "Flight from NYC to Paris",
         "hotel_plan": "Hotel in Paris city center",
         "summary": "Complete trip plan for NYC to Paris"
     })
     agent.runner = Mock()
-    agent.runner.run = mock_run
+    agent.runner.run_async = mock_run
     agent.session_manager = mock_session_manager
     
     request = AgentChatRequest(
@@ -0,0 +1,37 @@
+from src.agents.core.base_agent import BaseAgent
+from src.models.base_models import FeatureMap
+
+
+def test_features_to_dict_indexes_features_by_name():
+    features = [
+        FeatureMap(feature_name="limit", feature_value=3),
+        FeatureMap(feature_name="summary_length", feature_value=200),
+    ]
+
+    feat = BaseAgent._features_to_dict(features)
+
+    assert feat == {"limit": 3, "summary_length": 200}
+    assert feat.get("num_of_action_items", 5) == 5
+
+
+def test_features_to_dict_handles_missing_features():
+    assert BaseAgent._features_to_dict(None) == {}
+    assert BaseAgent._features_to_dict([]) == {}
+
+
+def test_feature_returns_default_and_applies_cap():
+    features = [FeatureMap(feature_name="num_of_action_items", feature_value=10)]
+
+    assert BaseAgent._feature(features, "limit", 5) == 5
+    assert BaseAgent._feature(features, "num_of_action_items", 3) == 10
+    assert BaseAgent._feature(features, "num_of_action_items", 3, cap=4) == 4
+    assert BaseAgent._feature(None, "num_of_action_items", 3, cap=4) == 3
+
+
+def test_feature_uses_last_value_for_repeated_name():
+    features = [
+        FeatureMap(feature_name="limit", feature_value=3),
+        FeatureMap(feature_name="limit", feature_value=7),
+    ]
+
+    assert BaseAgent._feature(features, "limit", 5) == BaseAgent._features_to_dict(features)["limit"] == 7
@@ -1,3 +1,4 @@
+import os
 import pathlib
 
 import pytest
@@ -26,23 +27,45 @@ def test_load_agent_config_with_explicit_path():
     assert cfg.agent_name == "health_assistant_agent"
 
 
-def test_load_agent_config_requires_some_source(monkeypatch):
+def test_load_agent_config_requires_some_source():
     """Test that load_agent_config raises ValueError when no source is provided.
     
-    We need to mock the stack inspection to prevent it from finding the test file.
+    The call is made from a namespace without ``__file__`` so stack-based
+    detection cannot find the test file.
     """
-    # Mock inspect.currentframe to return None, preventing stack-based detection
-    import inspect
-    
-    def mock_currentframe():
-        return None
-    
-    monkeypatch.setattr(inspect, "currentframe", mock_currentframe)
-    
     # The error message can be either format, so we check for ValueError with any message
     with pytest.raises(ValueError) as exc_info:
-        load_agent_config(agent_config=None, config_path=None, caller_file=None)
+        exec(
+            "load_agent_config(agent_config=None, config_path=None, caller_file=None)",
+            {"load_agent_config": load_agent_config},
+        )
     
     # Verify the error message contains key phrases
     error_msg = str(exc_info.value)
     assert "Cannot auto-detect" in error_msg or "Config path could not be resolved" in error_msg
+
+
+def test_load_agent_config_reuses_parsed_yaml_until_file_changes(tmp_path):
+    yaml_path = tmp_path / "main_agent.yaml"
+    yaml_path.write_text(
+        "agent_name: cached_agent\n"
+        "llm_provider_name: openai\n"
+        "llm_model: gpt-4o\n"
+        "temperature: 0.4\n"
+        "description: Cached agent\n"
+        "instruction_template: Be helpful.\n"
+    )
+
+    first = load_agent_config(config_path=str(yaml_path))
+    second = load_agent_config(config_path=str(yaml_path))
+
+    assert first is second
+
+    yaml_path.write_text(yaml_path.read_text().replace("Cached agent", "Edited agent"))
+    stat = yaml_path.stat()
+    os.utime(yaml_path, (stat.st_atime, stat.st_mtime + 1))
+
+    reloaded = load_agent_config(config_path=str(yaml_path))
+
+    assert reloaded is not first
+    assert reloaded.description == "Edited agent"
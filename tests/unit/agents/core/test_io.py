@@ -1,9 +1,10 @@
 import json
 from types import SimpleNamespace
 
+import pytest
 from pydantic import BaseModel, Field
 
-from src.agents.core.io import create_input_from_request, parse_agent_response
+from src.agents.core.io import AgentResponseParseError, create_input_from_request, parse_agent_response
 from src.models.base_models import AgentChatRequest
 
 
@@ -58,8 +59,14 @@ def test_parse_agent_response_happy_path():
     assert out.value == "ok"
 
 
-def test_parse_agent_response_bad_json_returns_raw():
+def test_parse_agent_response_bad_json_raises_with_raw_text():
     # content.parts[0].text is not valid JSON
     event = SimpleNamespace(content=SimpleNamespace(parts=[SimpleNamespace(text="not-json")]))
-    out = parse_agent_response(SimpleOutput, event)
-    assert out == "not-json"
\ No newline at end of file
+    with pytest.raises(AgentResponseParseError) as exc_info:
+        parse_agent_response(SimpleOutput, event)
+    assert exc_info.value.content_text == "not-json"
+
+
+def test_parse_agent_response_without_content_raises():
+    with pytest.raises(AgentResponseParseError):
+        parse_agent_response(SimpleOutput, None)
\ No newline at end of file
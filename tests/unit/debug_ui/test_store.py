@@ -0,0 +1,166 @@
+import fnmatch
+
+import pytest
+
+from debug_ui.store import InMemoryDebugStore, RedisDebugStore
+
+
+def make_session(session_id: str) -> dict:
+    return {
+        "session_id": session_id,
+        "agent_name": "dummy",
+        "created_at": "2026-01-01T00:00:00Z",
+        "message_count": 0,
+    }
+
+
+class FakePipeline:
+    """Queues commands and runs them against the owning FakeRedis on execute()."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        results = [await getattr(self._redis, name)(*args, **kwargs) for name, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+
+class FakeRedis:
+    """Minimal stand-in for redis.asyncio.Redis(decode_responses=True)."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+        self.stream = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    async def hsetnx(self, key, field, value):
+        self.hashes.setdefault(key, {}).setdefault(field, str(value))
+
+    async def hincrby(self, key, field, amount):
+        row = self.hashes.setdefault(key, {})
+        row[field] = str(int(row.get(field, 0)) + amount)
+
+    async def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def scan_iter(self, match):
+        for key in list(self.hashes):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def delete(self, key):
+        return 1 if self.hashes.pop(key, None) is not None else 0
+
+    async def xadd(self, name, fields, maxlen=None, approximate=True):
+        self.stream.append((str(len(self.stream)), dict(fields)))
+        if maxlen is not None:
+            del self.stream[:-maxlen]
+
+    async def xrange(self, name):
+        return [(entry_id, dict(fields)) for entry_id, fields in self.stream]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_evicts_oldest_sessions_first():
+    store = InMemoryDebugStore(max_sessions=2)
+
+    for session_id in ("s1", "s2", "s3"):
+        await store.create_session(make_session(session_id))
+
+    assert [s["session_id"] for s in await store.list_sessions()] == ["s2", "s3"]
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_record_message_creates_and_counts():
+    store = InMemoryDebugStore()
+
+    await store.record_message(make_session("s1"))
+    await store.record_message(make_session("s1"))
+
+    sessions = await store.list_sessions()
+    assert len(sessions) == 1
+    assert sessions[0]["message_count"] == 2
+
+    assert await store.delete_session("s1") is True
+    assert await store.delete_session("s1") is False
+
+
+@pytest.mark.asyncio
+async def test_in_memory_store_caps_feedback():
+    store = InMemoryDebugStore(max_feedback=2)
+
+    for index in range(3):
+        await store.add_feedback({"message_index": index})
+
+    assert await store.list_feedback() == [{"message_index": 1}, {"message_index": 2}]
+
+
+@pytest.mark.asyncio
+async def test_redis_store_record_message_creates_and_counts():
+    client = FakeRedis()
+    store = RedisDebugStore(client, session_ttl=60)
+
+    await store.record_message(make_session("s1"))
+    await store.record_message(make_session("s1"))
+
+    sessions = await store.list_sessions()
+    assert len(sessions) == 1
+    assert sessions[0]["session_id"] == "s1"
+    assert sessions[0]["message_count"] == 2
+    assert client.ttls == {"debug_ui:session:s1": 60}
+
+
+@pytest.mark.asyncio
+async def test_redis_store_delete_session():
+    store = RedisDebugStore(FakeRedis())
+
+    await store.create_session(make_session("s1"))
+
+    assert await store.delete_session("s1") is True
+    assert await store.delete_session("s1") is False
+    assert await store.list_sessions() == []
+
+
+@pytest.mark.asyncio
+async def test_redis_store_caps_feedback():
+    store = RedisDebugStore(FakeRedis(), max_feedback=2)
+
+    for index in range(3):
+        await store.add_feedback({"message_index": index, "feedback": "up"})
+
+    assert await store.list_feedback() == [
+        {"message_index": 1, "feedback": "up"},
+        {"message_index": 2, "feedback": "up"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_redis_store_round_trips_feedback_values():
+    store = RedisDebugStore(FakeRedis())
+    entry = {"session_id": "s1", "message_index": 0, "feedback": "down", "comment": None}
+
+    await store.add_feedback(entry)
+
+    assert await store.list_feedback() == [entry]